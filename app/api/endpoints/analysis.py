@@ -136,10 +136,11 @@ async def complete_business_analysis(
         # Perform comprehensive analysis
         analysis_result = business_analyzer.analyze_business_performance(validated_data)
         
-        # Generate insights
-        main_insight = insight_generator.generate_main_insight(analysis_result, validated_data)
-        problem_insights = insight_generator.generate_problem_insights(analysis_result, validated_data)
-        opportunity_insights = insight_generator.generate_opportunity_insights(analysis_result, validated_data)
+        # Generate insights (one shared prompt context for the whole business)
+        insights = await insight_generator.generate_all_insights(analysis_result, validated_data)
+        main_insight = insights["main_insight"]
+        problem_insights = insights["problem_insights"]
+        opportunity_insights = insights["opportunity_insights"]
         
         # Generate recommendations
         immediate_actions = recommendation_engine.generate_immediate_actions(analysis_result, validated_data)
@@ -6,7 +6,7 @@ from datetime import datetime
 import json
 
 from app.services.multi_gemini_service import MultiGeminiEngine
-from app.utils.prompt_templates import InsightPromptTemplates
+from app.utils.prompt_templates import InsightContext, InsightPromptTemplates
 
 logger = logging.getLogger(__name__)
 
@@ -16,7 +16,7 @@ class USInsightGenerator:
     
     def __init__(self):
         self.ai_engine = MultiGeminiEngine()
-        self.prompt_templates = InsightPromptTemplates()
+        self.prompt_templates = InsightPromptTemplates
         
         # Insight categories and their weights
         self.insight_categories = {
@@ -31,7 +31,8 @@ class USInsightGenerator:
     async def generate_main_insight(self, analysis_result: Dict[str, Any], 
                                   business_data: Dict[str, Any],
                                   economic_data: Dict[str, Any] = None,
-                                  market_data: Dict[str, Any] = None) -> Dict[str, Any]:
+                                  market_data: Dict[str, Any] = None,
+                                  prompt_context: Optional[InsightContext] = None) -> Dict[str, Any]:
         """Generate the primary business insight with highest impact."""
         
         logger.info("Generating main business insight")
@@ -42,7 +43,8 @@ class USInsightGenerator:
             
             # Generate targeted insight for the critical area
             insight_prompt = self.prompt_templates.get_main_insight_prompt(
-                critical_area, analysis_result, business_data, economic_data, market_data
+                critical_area, analysis_result, business_data, economic_data, market_data,
+                ctx=prompt_context
             )
             
             insight_response = await self.ai_engine._make_gemini_request(
@@ -76,7 +78,8 @@ class USInsightGenerator:
     
     async def generate_problem_insights(self, analysis_result: Dict[str, Any],
                                       business_data: Dict[str, Any],
-                                      economic_data: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+                                      economic_data: Dict[str, Any] = None,
+                                      prompt_context: Optional[InsightContext] = None) -> List[Dict[str, Any]]:
         """Generate insights about current business problems and challenges."""
         
         logger.info("Generating problem insights")
@@ -86,10 +89,12 @@ class USInsightGenerator:
             problems = self._identify_key_problems(analysis_result, business_data)
             
             problem_insights = []
+            if prompt_context is None:
+                prompt_context = InsightContext(business_data, analysis_result, economic_data)
             
             for problem in problems[:3]:  # Top 3 problems
                 insight_prompt = self.prompt_templates.get_problem_insight_prompt(
-                    problem, analysis_result, business_data, economic_data
+                    problem, analysis_result, business_data, economic_data, ctx=prompt_context
                 )
                 
                 insight_response = await self.ai_engine._make_gemini_request(
@@ -125,7 +130,8 @@ class USInsightGenerator:
     async def generate_opportunity_insights(self, analysis_result: Dict[str, Any],
                                           business_data: Dict[str, Any],
                                           economic_data: Dict[str, Any] = None,
-                                          market_data: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+                                          market_data: Dict[str, Any] = None,
+                                          prompt_context: Optional[InsightContext] = None) -> List[Dict[str, Any]]:
         """Generate insights about business opportunities and growth potential."""
         
         logger.info("Generating opportunity insights")
@@ -137,10 +143,13 @@ class USInsightGenerator:
             )
             
             opportunity_insights = []
+            if prompt_context is None:
+                prompt_context = InsightContext(business_data, analysis_result, economic_data, market_data)
             
             for opportunity in opportunities[:3]:  # Top 3 opportunities
                 insight_prompt = self.prompt_templates.get_opportunity_insight_prompt(
-                    opportunity, analysis_result, business_data, economic_data, market_data
+                    opportunity, analysis_result, business_data, economic_data, market_data,
+                    ctx=prompt_context
                 )
                 
                 insight_response = await self.ai_engine._make_gemini_request(
@@ -177,7 +186,8 @@ class USInsightGenerator:
     
     async def generate_market_insights(self, business_data: Dict[str, Any],
                                      market_data: Dict[str, Any],
-                                     economic_data: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+                                     economic_data: Dict[str, Any] = None,
+                                     prompt_context: Optional[InsightContext] = None) -> List[Dict[str, Any]]:
         """Generate insights about market conditions and competitive landscape."""
         
         logger.info("Generating market insights")
@@ -187,7 +197,7 @@ class USInsightGenerator:
             
             # Market position insight
             position_prompt = self.prompt_templates.get_market_position_insight_prompt(
-                business_data, market_data, economic_data
+                business_data, market_data, economic_data, ctx=prompt_context
             )
             
             position_response = await self.ai_engine._make_gemini_request(
@@ -249,7 +259,8 @@ class USInsightGenerator:
     
     async def generate_strategic_insights(self, analysis_result: Dict[str, Any],
                                         business_data: Dict[str, Any],
-                                        economic_data: Dict[str, Any] = None) -> List[Dict[str, Any]]:
+                                        economic_data: Dict[str, Any] = None,
+                                        prompt_context: Optional[InsightContext] = None) -> List[Dict[str, Any]]:
         """Generate strategic insights for long-term business success."""
         
         logger.info("Generating strategic insights")
@@ -259,7 +270,7 @@ class USInsightGenerator:
             
             # Growth strategy insight
             growth_prompt = self.prompt_templates.get_growth_strategy_insight_prompt(
-                analysis_result, business_data, economic_data
+                analysis_result, business_data, economic_data, ctx=prompt_context
             )
             
             growth_response = await self.ai_engine._make_gemini_request(
@@ -319,6 +330,36 @@ class USInsightGenerator:
             logger.error(f"Failed to generate strategic insights: {str(e)}")
             return [self._create_fallback_insight("strategic", str(e))]
     
+    async def generate_all_insights(self, analysis_result: Dict[str, Any],
+                                    business_data: Dict[str, Any],
+                                    economic_data: Dict[str, Any] = None,
+                                    market_data: Dict[str, Any] = None) -> Dict[str, Any]:
+        """Generate every insight category for one business.
+        
+        A single InsightContext is shared by all the prompts, so each summary
+        they embed is formatted at most once per business.
+        """
+        
+        prompt_context = InsightContext(business_data, analysis_result, economic_data, market_data)
+        
+        return {
+            "main_insight": await self.generate_main_insight(
+                analysis_result, business_data, economic_data, market_data, prompt_context
+            ),
+            "problem_insights": await self.generate_problem_insights(
+                analysis_result, business_data, economic_data, prompt_context
+            ),
+            "opportunity_insights": await self.generate_opportunity_insights(
+                analysis_result, business_data, economic_data, market_data, prompt_context
+            ),
+            "market_insights": await self.generate_market_insights(
+                business_data, market_data, economic_data, prompt_context
+            ),
+            "strategic_insights": await self.generate_strategic_insights(
+                analysis_result, business_data, economic_data, prompt_context
+            ),
+        }
+    
     def _identify_critical_area(self, analysis_result: Dict[str, Any], 
                                business_data: Dict[str, Any]) -> str:
         """Identify the most critical area requiring immediate attention."""
@@ -13,6 +13,352 @@ from app.config import GEMINI_KEYS, OPENROUTER_KEYS, settings
 
 logger = logging.getLogger(__name__)
 
+# Static JSON response schemas appended to each analysis prompt. Only the
+# header of a prompt depends on request data.
+_BUSINESS_PERFORMANCE_SCHEMA = """
+        {
+            "performance_score": <0-100 score>,
+            "revenue_analysis": {
+                "trend": "<increasing/declining/stable>",
+                "growth_rate": <monthly growth rate>,
+                "stability_score": <0-100>,
+                "seasonal_patterns": "<description>"
+            },
+            "financial_health": {
+                "profit_margin": <percentage>,
+                "cash_runway_months": <number>,
+                "debt_to_revenue_ratio": <percentage>,
+                "liquidity_score": <0-100>
+            },
+            "economic_impact": {
+                "fed_rate_impact": "<positive/negative/neutral>",
+                "inflation_impact": "<positive/negative/neutral>",
+                "overall_economic_tailwind": <-100 to +100>
+            },
+            "key_strengths": ["<strength 1>", "<strength 2>", "<strength 3>"],
+            "key_weaknesses": ["<weakness 1>", "<weakness 2>", "<weakness 3>"],
+            "immediate_concerns": ["<concern 1>", "<concern 2>"],
+            "performance_vs_industry": "<above_average/average/below_average>",
+            "confidence_level": <0-100>
+        }
+        
+        Be specific with dollar amounts, percentages, and timeframes.
+        """
+
+_MARKET_POSITION_SCHEMA = """
+        {
+            "market_position": {
+                "percentile_rank": <0-100>,
+                "market_share_estimate": <percentage>,
+                "competitive_advantage": "<strong/moderate/weak>",
+                "market_positioning": "<leader/follower/niche/struggling>"
+            },
+            "competitive_landscape": {
+                "competition_intensity": <1-10 scale>,
+                "barriers_to_entry": "<high/medium/low>",
+                "competitive_threats": ["<threat 1>", "<threat 2>"],
+                "competitive_opportunities": ["<opportunity 1>", "<opportunity 2>"]
+            },
+            "market_trends": {
+                "sector_outlook": "<growing/stable/declining>",
+                "technology_disruption_risk": <1-10 scale>,
+                "demographic_trends_impact": "<positive/negative/neutral>",
+                "regulatory_environment": "<supportive/neutral/challenging>"
+            },
+            "growth_potential": {
+                "organic_growth_potential": <1-10 scale>,
+                "market_expansion_opportunities": ["<opportunity 1>", "<opportunity 2>"],
+                "acquisition_opportunities": <true/false>,
+                "new_market_segments": ["<segment 1>", "<segment 2>"]
+            },
+            "location_analysis": {
+                "location_advantage": <1-10 scale>,
+                "foot_traffic_potential": "<high/medium/low>",
+                "rent_to_revenue_ratio": <percentage>,
+                "expansion_locations": ["<location 1>", "<location 2>"]
+            },
+            "strategic_positioning": {
+                "recommended_strategy": "<differentiation/cost_leadership/focus>",
+                "pricing_power": <1-10 scale>,
+                "brand_strength": <1-10 scale>,
+                "customer_loyalty": <1-10 scale>
+            },
+            "confidence_level": <0-100>
+        }
+       
+        Focus on actionable insights specific to US small business market dynamics.
+        """
+
+_STRATEGIC_RECOMMENDATIONS_SCHEMA = """
+        {
+            "immediate_actions": [
+                {
+                    "action": "<specific action>",
+                    "timeframe": "<this week/this month>",
+                    "expected_impact": "<revenue/cost/efficiency gain>",
+                    "investment_required": <dollar amount>,
+                    "roi_timeline": "<weeks/months>",
+                    "implementation_steps": ["<step 1>", "<step 2>", "<step 3>"]
+                }
+            ],
+            "short_term_strategies": [
+                {
+                    "strategy": "<strategic initiative>",
+                    "timeframe": "<1-3 months>",
+                    "expected_outcome": "<specific measurable outcome>",
+                    "investment_required": <dollar amount>,
+                    "risk_level": "<low/medium/high>",
+                    "success_probability": <percentage>
+                }
+            ],
+            "long_term_vision": [
+                {
+                    "initiative": "<major initiative>",
+                    "timeframe": "<6-12 months>",
+                    "transformational_impact": "<description>",
+                    "capital_requirement": <dollar amount>,
+                    "strategic_value": <1-10 scale>
+                }
+            ],
+            "operational_improvements": [
+                {
+                    "area": "<operations/marketing/finance/technology>",
+                    "improvement": "<specific improvement>",
+                    "cost_savings": <annual dollar amount>,
+                    "implementation_complexity": "<low/medium/high>"
+                }
+            ],
+            "risk_mitigation": [
+                {
+                    "risk": "<specific risk>",
+                    "mitigation_strategy": "<strategy>",
+                    "cost_of_inaction": <dollar amount>,
+                    "implementation_priority": "<high/medium/low>"
+                }
+            ],
+            "growth_acceleration": {
+                "revenue_optimization": ["<tactic 1>", "<tactic 2>"],
+                "market_expansion": ["<approach 1>", "<approach 2>"],
+                "efficiency_gains": ["<improvement 1>", "<improvement 2>"],
+                "competitive_advantages": ["<advantage 1>", "<advantage 2>"]
+            },
+            "confidence_level": <0-100>
+        }
+        
+        All recommendations must be specific, measurable, and include dollar amounts where applicable.
+        """
+
+_INVESTMENT_OPPORTUNITIES_SCHEMA = """
+        {
+            "investment_capacity": {
+                "available_capital": <dollar amount>,
+                "recommended_allocation": {
+                    "business_reinvestment": <percentage>,
+                    "emergency_fund": <percentage>,
+                    "growth_investments": <percentage>,
+                    "market_investments": <percentage>
+                },
+                "risk_tolerance": "<conservative/moderate/aggressive>"
+            },
+            "business_reinvestment": [
+                {
+                    "investment_type": "<equipment/inventory/marketing/technology>",
+                    "amount": <dollar amount>,
+                    "expected_roi": <percentage>,
+                    "payback_period": "<months>",
+                    "strategic_value": <1-10 scale>
+                }
+            ],
+            "market_investments": [
+                {
+                    "investment_vehicle": "<stocks/bonds/etfs/real_estate>",
+                    "sector_focus": "<technology/healthcare/finance/diversified>",
+                    "amount": <dollar amount>,
+                    "expected_annual_return": <percentage>,
+                    "risk_level": "<low/medium/high>",
+                    "time_horizon": "<short/medium/long>"
+                }
+            ],
+            "sector_specific_opportunities": [
+                {
+                    "opportunity": "<specific to business sector>",
+                    "investment_amount": <dollar amount>,
+                    "strategic_alignment": <1-10 scale>,
+                    "market_timing": "<excellent/good/fair/poor>"
+                }
+            ],
+            "tax_optimization": [
+                {
+                    "strategy": "<tax strategy>",
+                    "annual_savings": <dollar amount>,
+                    "implementation_complexity": "<low/medium/high>"
+                }
+            ],
+            "exit_strategy_planning": {
+                "business_valuation_estimate": <dollar amount>,
+                "value_enhancement_opportunities": ["<opportunity 1>", "<opportunity 2>"],
+                "optimal_exit_timeline": "<years>",
+                "preparation_steps": ["<step 1>", "<step 2>"]
+            },
+            "confidence_level": <0-100>
+        }
+        
+        Focus on practical, implementable investment strategies for small business owners.
+        """
+
+_RISK_ASSESSMENT_SCHEMA = """
+        {
+            "overall_risk_score": <0-100>,
+            "risk_categories": {
+                "financial_risk": {
+                    "score": <0-100>,
+                    "key_factors": ["<factor 1>", "<factor 2>"],
+                    "mitigation_strategies": ["<strategy 1>", "<strategy 2>"]
+                },
+                "operational_risk": {
+                    "score": <0-100>,
+                    "key_factors": ["<factor 1>", "<factor 2>"],
+                    "mitigation_strategies": ["<strategy 1>", "<strategy 2>"]
+                },
+                "market_risk": {
+                    "score": <0-100>,
+                    "key_factors": ["<factor 1>", "<factor 2>"],
+                    "mitigation_strategies": ["<strategy 1>", "<strategy 2>"]
+                },
+                "economic_risk": {
+                    "score": <0-100>,
+                    "key_factors": ["<factor 1>", "<factor 2>"],
+                    "mitigation_strategies": ["<strategy 1>", "<strategy 2>"]
+                },
+                "regulatory_risk": {
+                    "score": <0-100>,
+                    "key_factors": ["<factor 1>", "<factor 2>"],
+                    "mitigation_strategies": ["<strategy 1>", "<strategy 2>"]
+                }
+            },
+            "critical_vulnerabilities": [
+                {
+                    "vulnerability": "<specific vulnerability>",
+                    "impact_severity": "<low/medium/high/critical>",
+                    "probability": <percentage>,
+                    "time_to_impact": "<immediate/short/medium/long>",
+                    "mitigation_cost": <dollar amount>
+                }
+            ],
+            "scenario_analysis": {
+                "best_case": {
+                    "probability": <percentage>,
+                    "revenue_impact": <percentage change>,
+                    "key_drivers": ["<driver 1>", "<driver 2>"]
+                },
+                "most_likely": {
+                    "probability": <percentage>,
+                    "revenue_impact": <percentage change>,
+                    "key_drivers": ["<driver 1>", "<driver 2>"]
+                },
+                "worst_case": {
+                    "probability": <percentage>,
+                    "revenue_impact": <percentage change>,
+                    "key_drivers": ["<driver 1>", "<driver 2>"]
+                }
+            },
+            "insurance_recommendations": [
+                {
+                    "coverage_type": "<coverage type>",
+                    "coverage_amount": <dollar amount>,
+                    "annual_premium_estimate": <dollar amount>,
+                    "priority": "<high/medium/low>"
+                }
+            ],
+            "contingency_planning": [
+                {
+                    "scenario": "<risk scenario>",
+                    "response_plan": "<plan description>",
+                    "resource_requirements": <dollar amount>,
+                    "preparation_timeline": "<timeframe>"
+                }
+            ],
+            "confidence_level": <0-100>
+        }
+        
+        Be specific about dollar amounts for mitigation costs and potential impacts.
+        """
+
+_SYNTHESIS_SCHEMA = """
+        {
+            "executive_summary": {
+                "overall_health_score": <0-100>,
+                "business_stage": "<startup/growth/mature/declining>",
+                "competitive_position": "<leader/strong/average/weak>",
+                "financial_stability": "<excellent/good/fair/poor>",
+                "growth_trajectory": "<accelerating/steady/slowing/declining>",
+                "key_message": "<one sentence summary>",
+                "confidence_level": <0-100>
+            },
+            "critical_insights": [
+                {
+                    "insight": "<critical insight>",
+                    "impact": "<high/medium/low>",
+                    "urgency": "<immediate/short_term/long_term>",
+                    "action_required": "<specific action>"
+                }
+            ],
+            "performance_dashboard": {
+                "revenue_score": <0-100>,
+                "profitability_score": <0-100>,
+                "growth_score": <0-100>,
+                "efficiency_score": <0-100>,
+                "market_position_score": <0-100>,
+                "risk_score": <0-100>
+            },
+            "priority_recommendations": [
+                {
+                    "priority": <1-5>,
+                    "recommendation": "<specific recommendation>",
+                    "expected_impact": "<quantified impact>",
+                    "investment_required": <dollar amount>,
+                    "implementation_timeline": "<timeframe>",
+                    "roi_estimate": <percentage>
+                }
+            ],
+            "investment_allocation": {
+                "immediate_needs": <dollar amount>,
+                "growth_investments": <dollar amount>,
+                "risk_mitigation": <dollar amount>,
+                "market_opportunities": <dollar amount>,
+                "total_recommended": <dollar amount>
+            },
+            "performance_projections": {
+                "3_month_revenue_projection": <dollar amount>,
+                "6_month_revenue_projection": <dollar amount>,
+                "12_month_revenue_projection": <dollar amount>,
+                "break_even_timeline": "<months>",
+                "growth_rate_projection": <percentage>
+            },
+            "competitive_advantages": [
+                {
+                    "advantage": "<specific advantage>",
+                    "strength": <1-10 scale>,
+                    "sustainability": "<high/medium/low>",
+                    "leverage_strategy": "<how to leverage>"
+                }
+            ],
+            "risk_mitigation_plan": [
+                {
+                    "risk": "<top risk>",
+                    "mitigation_action": "<specific action>",
+                    "cost": <dollar amount>,
+                    "timeline": "<implementation timeframe>",
+                    "success_probability": <percentage>
+                }
+            ],
+            "next_review_date": "<date>",
+            "confidence_level": <0-100>
+        }
+        
+        Ensure all dollar amounts and percentages are realistic and actionable.
+        """
+
 
 class MultiGeminiEngine:
     """Advanced multi-Gemini AI analysis engine with intelligent routing."""
@@ -143,35 +489,7 @@ class MultiGeminiEngine:
         - Consumer Confidence: {economic_data.get('consumer_confidence', 'N/A')}
         - Small Business Optimism: {economic_data.get('small_business_optimism', 'N/A')}
         
-        PROVIDE DETAILED ANALYSIS IN JSON FORMAT:
-        {{
-            "performance_score": <0-100 score>,
-            "revenue_analysis": {{
-                "trend": "<increasing/declining/stable>",
-                "growth_rate": <monthly growth rate>,
-                "stability_score": <0-100>,
-                "seasonal_patterns": "<description>"
-            }},
-            "financial_health": {{
-                "profit_margin": <percentage>,
-                "cash_runway_months": <number>,
-                "debt_to_revenue_ratio": <percentage>,
-                "liquidity_score": <0-100>
-            }},
-            "economic_impact": {{
-                "fed_rate_impact": "<positive/negative/neutral>",
-                "inflation_impact": "<positive/negative/neutral>",
-                "overall_economic_tailwind": <-100 to +100>
-            }},
-            "key_strengths": ["<strength 1>", "<strength 2>", "<strength 3>"],
-            "key_weaknesses": ["<weakness 1>", "<weakness 2>", "<weakness 3>"],
-            "immediate_concerns": ["<concern 1>", "<concern 2>"],
-            "performance_vs_industry": "<above_average/average/below_average>",
-            "confidence_level": <0-100>
-        }}
-        
-        Be specific with dollar amounts, percentages, and timeframes.
-        """
+        PROVIDE DETAILED ANALYSIS IN JSON FORMAT:""" + _BUSINESS_PERFORMANCE_SCHEMA
         
         return await self._make_gemini_request(key, prompt, "business_analysis")
     
@@ -199,49 +517,7 @@ class MultiGeminiEngine:
         - Competition Level: {market_data.get('competition_level', 'N/A')}
         - Economic Health Score: {economic_data.get('economic_health_score', 'N/A')}/100
         
-        PROVIDE MARKET ANALYSIS IN JSON FORMAT:
-        {{
-            "market_position": {{
-                "percentile_rank": <0-100>,
-                "market_share_estimate": <percentage>,
-                "competitive_advantage": "<strong/moderate/weak>",
-                "market_positioning": "<leader/follower/niche/struggling>"
-            }},
-            "competitive_landscape": {{
-                "competition_intensity": <1-10 scale>,
-                "barriers_to_entry": "<high/medium/low>",
-                "competitive_threats": ["<threat 1>", "<threat 2>"],
-                "competitive_opportunities": ["<opportunity 1>", "<opportunity 2>"]
-            }},
-            "market_trends": {{
-                "sector_outlook": "<growing/stable/declining>",
-                "technology_disruption_risk": <1-10 scale>,
-                "demographic_trends_impact": "<positive/negative/neutral>",
-                "regulatory_environment": "<supportive/neutral/challenging>"
-            }},
-            "growth_potential": {{
-                "organic_growth_potential": <1-10 scale>,
-                "market_expansion_opportunities": ["<opportunity 1>", "<opportunity 2>"],
-                "acquisition_opportunities": <true/false>,
-                "new_market_segments": ["<segment 1>", "<segment 2>"]
-            }},
-            "location_analysis": {{
-                "location_advantage": <1-10 scale>,
-                "foot_traffic_potential": "<high/medium/low>",
-                "rent_to_revenue_ratio": <percentage>,
-                "expansion_locations": ["<location 1>", "<location 2>"]
-            }},
-            "strategic_positioning": {{
-                "recommended_strategy": "<differentiation/cost_leadership/focus>",
-                "pricing_power": <1-10 scale>,
-                "brand_strength": <1-10 scale>,
-                "customer_loyalty": <1-10 scale>
-            }},
-            "confidence_level": <0-100>
-        }}
-       
-        Focus on actionable insights specific to US small business market dynamics.
-        """
+        PROVIDE MARKET ANALYSIS IN JSON FORMAT:""" + _MARKET_POSITION_SCHEMA
 
         return await self._make_gemini_request(key, prompt, "market_intelligence")
    
@@ -271,64 +547,7 @@ class MultiGeminiEngine:
         - Business Climate Score: {economic_data.get('business_climate_score', 'N/A')}/100
         - Small Business Impact: {economic_data.get('small_business_impact', {}).get('overall_impact', 'N/A')}
         
-        PROVIDE STRATEGIC RECOMMENDATIONS IN JSON FORMAT:
-        {{
-            "immediate_actions": [
-                {{
-                    "action": "<specific action>",
-                    "timeframe": "<this week/this month>",
-                    "expected_impact": "<revenue/cost/efficiency gain>",
-                    "investment_required": <dollar amount>,
-                    "roi_timeline": "<weeks/months>",
-                    "implementation_steps": ["<step 1>", "<step 2>", "<step 3>"]
-                }}
-            ],
-            "short_term_strategies": [
-                {{
-                    "strategy": "<strategic initiative>",
-                    "timeframe": "<1-3 months>",
-                    "expected_outcome": "<specific measurable outcome>",
-                    "investment_required": <dollar amount>,
-                    "risk_level": "<low/medium/high>",
-                    "success_probability": <percentage>
-                }}
-            ],
-            "long_term_vision": [
-                {{
-                    "initiative": "<major initiative>",
-                    "timeframe": "<6-12 months>",
-                    "transformational_impact": "<description>",
-                    "capital_requirement": <dollar amount>,
-                    "strategic_value": <1-10 scale>
-                }}
-            ],
-            "operational_improvements": [
-                {{
-                    "area": "<operations/marketing/finance/technology>",
-                    "improvement": "<specific improvement>",
-                    "cost_savings": <annual dollar amount>,
-                    "implementation_complexity": "<low/medium/high>"
-                }}
-            ],
-            "risk_mitigation": [
-                {{
-                    "risk": "<specific risk>",
-                    "mitigation_strategy": "<strategy>",
-                    "cost_of_inaction": <dollar amount>,
-                    "implementation_priority": "<high/medium/low>"
-                }}
-            ],
-            "growth_acceleration": {{
-                "revenue_optimization": ["<tactic 1>", "<tactic 2>"],
-                "market_expansion": ["<approach 1>", "<approach 2>"],
-                "efficiency_gains": ["<improvement 1>", "<improvement 2>"],
-                "competitive_advantages": ["<advantage 1>", "<advantage 2>"]
-            }},
-            "confidence_level": <0-100>
-        }}
-        
-        All recommendations must be specific, measurable, and include dollar amounts where applicable.
-        """
+        PROVIDE STRATEGIC RECOMMENDATIONS IN JSON FORMAT:""" + _STRATEGIC_RECOMMENDATIONS_SCHEMA
         
         return await self._make_gemini_request(key, prompt, "recommendations")
     
@@ -358,63 +577,7 @@ class MultiGeminiEngine:
         - Economic Health: {economic_data.get('economic_health_score', 'N/A')}/100
         - Market Conditions: {economic_data.get('small_business_impact', {}).get('overall_impact', 'N/A')}
         
-        PROVIDE INVESTMENT ANALYSIS IN JSON FORMAT:
-        {{
-            "investment_capacity": {{
-                "available_capital": <dollar amount>,
-                "recommended_allocation": {{
-                    "business_reinvestment": <percentage>,
-                    "emergency_fund": <percentage>,
-                    "growth_investments": <percentage>,
-                    "market_investments": <percentage>
-                }},
-                "risk_tolerance": "<conservative/moderate/aggressive>"
-            }},
-            "business_reinvestment": [
-                {{
-                    "investment_type": "<equipment/inventory/marketing/technology>",
-                    "amount": <dollar amount>,
-                    "expected_roi": <percentage>,
-                    "payback_period": "<months>",
-                    "strategic_value": <1-10 scale>
-                }}
-            ],
-            "market_investments": [
-                {{
-                    "investment_vehicle": "<stocks/bonds/etfs/real_estate>",
-                    "sector_focus": "<technology/healthcare/finance/diversified>",
-                    "amount": <dollar amount>,
-                    "expected_annual_return": <percentage>,
-                    "risk_level": "<low/medium/high>",
-                    "time_horizon": "<short/medium/long>"
-                }}
-            ],
-            "sector_specific_opportunities": [
-                {{
-                    "opportunity": "<specific to business sector>",
-                    "investment_amount": <dollar amount>,
-                    "strategic_alignment": <1-10 scale>,
-                    "market_timing": "<excellent/good/fair/poor>"
-                }}
-            ],
-            "tax_optimization": [
-                {{
-                    "strategy": "<tax strategy>",
-                    "annual_savings": <dollar amount>,
-                    "implementation_complexity": "<low/medium/high>"
-                }}
-            ],
-            "exit_strategy_planning": {{
-                "business_valuation_estimate": <dollar amount>,
-                "value_enhancement_opportunities": ["<opportunity 1>", "<opportunity 2>"],
-                "optimal_exit_timeline": "<years>",
-                "preparation_steps": ["<step 1>", "<step 2>"]
-            }},
-            "confidence_level": <0-100>
-        }}
-        
-        Focus on practical, implementable investment strategies for small business owners.
-        """
+        PROVIDE INVESTMENT ANALYSIS IN JSON FORMAT:""" + _INVESTMENT_OPPORTUNITIES_SCHEMA
         
         return await self._make_gemini_request(key, prompt, "investment_advice")
     
@@ -441,83 +604,7 @@ class MultiGeminiEngine:
         - Economic Health: {economic_data.get('economic_health_score', 'N/A')}/100
         - Sector Outlook: {market_data.get('sector_outlook', 'N/A')}
         
-        PROVIDE RISK ASSESSMENT IN JSON FORMAT:
-        {{
-            "overall_risk_score": <0-100>,
-            "risk_categories": {{
-                "financial_risk": {{
-                    "score": <0-100>,
-                    "key_factors": ["<factor 1>", "<factor 2>"],
-                    "mitigation_strategies": ["<strategy 1>", "<strategy 2>"]
-                }},
-                "operational_risk": {{
-                    "score": <0-100>,
-                    "key_factors": ["<factor 1>", "<factor 2>"],
-                    "mitigation_strategies": ["<strategy 1>", "<strategy 2>"]
-                }},
-                "market_risk": {{
-                    "score": <0-100>,
-                    "key_factors": ["<factor 1>", "<factor 2>"],
-                    "mitigation_strategies": ["<strategy 1>", "<strategy 2>"]
-                }},
-                "economic_risk": {{
-                    "score": <0-100>,
-                    "key_factors": ["<factor 1>", "<factor 2>"],
-                    "mitigation_strategies": ["<strategy 1>", "<strategy 2>"]
-                }},
-                "regulatory_risk": {{
-                    "score": <0-100>,
-                    "key_factors": ["<factor 1>", "<factor 2>"],
-                    "mitigation_strategies": ["<strategy 1>", "<strategy 2>"]
-                }}
-            }},
-            "critical_vulnerabilities": [
-                {{
-                    "vulnerability": "<specific vulnerability>",
-                    "impact_severity": "<low/medium/high/critical>",
-                    "probability": <percentage>,
-                    "time_to_impact": "<immediate/short/medium/long>",
-                    "mitigation_cost": <dollar amount>
-                }}
-            ],
-            "scenario_analysis": {{
-                "best_case": {{
-                    "probability": <percentage>,
-                    "revenue_impact": <percentage change>,
-                    "key_drivers": ["<driver 1>", "<driver 2>"]
-                }},
-                "most_likely": {{
-                    "probability": <percentage>,
-                    "revenue_impact": <percentage change>,
-                    "key_drivers": ["<driver 1>", "<driver 2>"]
-                }},
-                "worst_case": {{
-                    "probability": <percentage>,
-                    "revenue_impact": <percentage change>,
-                    "key_drivers": ["<driver 1>", "<driver 2>"]
-                }}
-            }},
-            "insurance_recommendations": [
-                {{
-                    "coverage_type": "<coverage type>",
-                    "coverage_amount": <dollar amount>,
-                    "annual_premium_estimate": <dollar amount>,
-                    "priority": "<high/medium/low>"
-                }}
-            ],
-            "contingency_planning": [
-                {{
-                    "scenario": "<risk scenario>",
-                    "response_plan": "<plan description>",
-                    "resource_requirements": <dollar amount>,
-                    "preparation_timeline": "<timeframe>"
-                }}
-            ],
-            "confidence_level": <0-100>
-        }}
-        
-        Be specific about dollar amounts for mitigation costs and potential impacts.
-        """
+        PROVIDE RISK ASSESSMENT IN JSON FORMAT:""" + _RISK_ASSESSMENT_SCHEMA
         
         return await self._make_gemini_request(key, prompt, "risk_assessment")
     
@@ -541,80 +628,7 @@ class MultiGeminiEngine:
         ANALYSIS RESULTS:
         {analysis_summary}
         
-        PROVIDE SYNTHESIZED INTELLIGENCE IN JSON FORMAT:
-        {{
-            "executive_summary": {{
-                "overall_health_score": <0-100>,
-                "business_stage": "<startup/growth/mature/declining>",
-                "competitive_position": "<leader/strong/average/weak>",
-                "financial_stability": "<excellent/good/fair/poor>",
-                "growth_trajectory": "<accelerating/steady/slowing/declining>",
-                "key_message": "<one sentence summary>",
-                "confidence_level": <0-100>
-            }},
-            "critical_insights": [
-                {{
-                    "insight": "<critical insight>",
-                    "impact": "<high/medium/low>",
-                    "urgency": "<immediate/short_term/long_term>",
-                    "action_required": "<specific action>"
-                }}
-            ],
-            "performance_dashboard": {{
-                "revenue_score": <0-100>,
-                "profitability_score": <0-100>,
-                "growth_score": <0-100>,
-                "efficiency_score": <0-100>,
-                "market_position_score": <0-100>,
-                "risk_score": <0-100>
-            }},
-            "priority_recommendations": [
-                {{
-                    "priority": <1-5>,
-                    "recommendation": "<specific recommendation>",
-                    "expected_impact": "<quantified impact>",
-                    "investment_required": <dollar amount>,
-                    "implementation_timeline": "<timeframe>",
-                    "roi_estimate": <percentage>
-                }}
-            ],
-            "investment_allocation": {{
-                "immediate_needs": <dollar amount>,
-                "growth_investments": <dollar amount>,
-                "risk_mitigation": <dollar amount>,
-                "market_opportunities": <dollar amount>,
-                "total_recommended": <dollar amount>
-            }},
-            "performance_projections": {{
-                "3_month_revenue_projection": <dollar amount>,
-                "6_month_revenue_projection": <dollar amount>,
-                "12_month_revenue_projection": <dollar amount>,
-                "break_even_timeline": "<months>",
-                "growth_rate_projection": <percentage>
-            }},
-            "competitive_advantages": [
-                {{
-                    "advantage": "<specific advantage>",
-                    "strength": <1-10 scale>,
-                    "sustainability": "<high/medium/low>",
-                    "leverage_strategy": "<how to leverage>"
-                }}
-            ],
-            "risk_mitigation_plan": [
-                {{
-                    "risk": "<top risk>",
-                    "mitigation_action": "<specific action>",
-                    "cost": <dollar amount>,
-                    "timeline": "<implementation timeframe>",
-                    "success_probability": <percentage>
-                }}
-            ],
-            "next_review_date": "<date>",
-            "confidence_level": <0-100>
-        }}
-        
-        Ensure all dollar amounts and percentages are realistic and actionable.
-        """
+        PROVIDE SYNTHESIZED INTELLIGENCE IN JSON FORMAT:""" + _SYNTHESIS_SCHEMA
         
         synthesis_result = await self._make_gemini_request(key, prompt, "synthesis")
         
@@ -1,42 +1,257 @@
 """Optimized prompt templates for US small business AI analysis."""
 
-from typing import Dict, Any, Optional
+from functools import cached_property, lru_cache
+from typing import Any, Dict, NamedTuple, Optional, Tuple
 import json
+import logging
+import math
+import sys
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Placeholder rendered for any missing field.
+_NA = sys.intern("N/A")
+
+
+def _has_non_finite(obj: Any) -> bool:
+    """Return True if obj holds a NaN or infinite float anywhere inside it."""
+    if isinstance(obj, float):
+        return not math.isfinite(obj)
+    if isinstance(obj, dict):
+        return any(_has_non_finite(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_non_finite(value) for value in obj)
+    return False
+
+
+def _dumps(obj: Any) -> str:
+    """Pretty-print data as indented JSON for embedding in a prompt."""
+    if orjson is not None:
+        try:
+            data = orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+        else:
+            # orjson writes NaN and infinity as null; keep json's spelling of
+            # them so the model sees the value that was actually recorded.
+            if b"null" not in data or not _has_non_finite(obj):
+                return data.decode()
+    return json.dumps(obj, indent=2, separators=(",", ": "))
+
+
+# Interned top-level section keys of the analysis and economic dicts.
+_K_OVERALL_SCORE = sys.intern("overall_score")
+_K_FINANCIAL_HEALTH = sys.intern("financial_health")
+_K_MARKET_POSITION = sys.intern("market_position")
+_K_RISK_ASSESSMENT = sys.intern("risk_assessment")
+_K_GROWTH_ANALYSIS = sys.intern("growth_analysis")
+_K_SMALL_BUSINESS_IMPACT = sys.intern("small_business_impact")
+_K_PERFORMANCE_METRICS = sys.intern("performance_metrics")
+_K_COMPETITIVE_ANALYSIS = sys.intern("competitive_analysis")
+
+# Key paths into the analysis and economic dicts, resolved with _pluck.
+_OS_SCORE = (_K_OVERALL_SCORE, 'overall_score')
+_OS_IMPROVEMENT_AREAS = (_K_OVERALL_SCORE, 'improvement_areas')
+_OS_STRENGTHS = (_K_OVERALL_SCORE, 'strengths')
+_FH_STATUS = (_K_FINANCIAL_HEALTH, 'status')
+_FH_CASH_RUNWAY = (_K_FINANCIAL_HEALTH, 'cash_runway_months')
+_FH_CASH_FLOW = (_K_FINANCIAL_HEALTH, 'monthly_cash_flow')
+_FH_DEBT_CAPACITY = (_K_FINANCIAL_HEALTH, 'debt_capacity')
+_FH_HEALTH_SCORE = (_K_FINANCIAL_HEALTH, 'health_score')
+_MP_CATEGORY = (_K_MARKET_POSITION, 'performance_category')
+_RA_LEVEL = (_K_RISK_ASSESSMENT, 'risk_level')
+_RA_SCORE = (_K_RISK_ASSESSMENT, 'overall_risk_score')
+_GA_SCORE = (_K_GROWTH_ANALYSIS, 'growth_score')
+_GA_READINESS = (_K_GROWTH_ANALYSIS, 'expansion_readiness', 'readiness_level')
+_SBI_FINANCING = (_K_SMALL_BUSINESS_IMPACT, 'financing_cost_impact')
+_SBI_OVERALL = (_K_SMALL_BUSINESS_IMPACT, 'overall_impact')
+
+
+def _pluck(data: Dict[str, Any], path: Tuple[str, ...], default: Any) -> Any:
+    """Walk a key path through nested dicts, returning default if any key is missing."""
+    for key in path:
+        try:
+            data = data[key]
+        except (KeyError, TypeError):
+            return default
+    return data
+
+
+_EMPTY: Dict[str, Any] = {}
+
+
+def _section(data: Dict[str, Any], key: str) -> Dict[str, Any]:
+    """Return the nested dict under key, or an empty dict if it is missing or not a dict."""
+    section = data.get(key)
+    return section if isinstance(section, dict) else _EMPTY
+
+
+def _current_revenue(business_data: Dict[str, Any]) -> float:
+    """Return the most recent monthly revenue, or 0 when none is recorded."""
+    revenue = business_data.get('monthly_revenue')
+    return revenue[-1] if revenue else 0
+
+
+def _render_economic_context(fed_funds_rate: Any, inflation_cpi: Any, unemployment_rate: Any,
+                             consumer_confidence: Any, economic_health_score: Any,
+                             small_business_impact: Any) -> str:
+    """Render the economic environment section shared by the insight prompts."""
+
+    return f"""
+        CURRENT US ECONOMIC ENVIRONMENT:
+        - Federal Funds Rate: {fed_funds_rate}%
+        - Inflation (CPI): {inflation_cpi}
+        - Unemployment Rate: {unemployment_rate}%
+        - Consumer Confidence: {consumer_confidence}
+        - Economic Health Score: {economic_health_score}/100
+        - Small Business Climate: {small_business_impact}
+        """
 
 
-class InsightPromptTemplates:
-    """Specialized prompt templates for generating business insights."""
-    
-    def get_main_insight_prompt(self, critical_area: str, analysis_result: Dict[str, Any],
-                               business_data: Dict[str, Any], economic_data: Dict[str, Any] = None,
-                               market_data: Dict[str, Any] = None) -> str:
-        """Generate prompt for main business insight."""
-        
-        current_revenue = business_data.get('monthly_revenue', [0])[-1] if business_data.get('monthly_revenue') else 0
-        
-        prompt = f"""
-        EXPERT US SMALL BUSINESS ADVISOR ROLE:
-        
-        Generate the single most critical insight for this US small business based on comprehensive analysis.
-        
-        BUSINESS PROFILE:
-        - Business: {business_data.get('business_name', 'US Small Business')}
-        - Sector: {business_data.get('sector', 'N/A')}
-        - Location: {business_data.get('location', 'N/A')}
-        - Current Monthly Revenue: ${current_revenue:,.0f}
-        - Monthly Expenses: ${business_data.get('monthly_expenses', 0):,.0f}
-        - Cash Position: ${business_data.get('current_cash', 0):,.0f}
-        - Years Operating: {business_data.get('years_in_business', 0)}
-        
-        CRITICAL AREA IDENTIFIED: {critical_area}
-        
-        ANALYSIS SUMMARY:
-        {self._format_analysis_summary(analysis_result)}
-        
-        {self._add_economic_context_to_prompt(economic_data) if economic_data else ""}
-        
-        GENERATE THE MOST IMPORTANT INSIGHT IN JSON FORMAT:
-        {{
+# The same economic snapshot is rendered into every insight prompt of a request.
+_economic_context = lru_cache(maxsize=128, typed=True)(_render_economic_context)
+
+
+def _format_analysis_summary(analysis_result: Dict[str, Any]) -> str:
+    """Format analysis results into readable summary."""
+
+    summary_parts = []
+
+    # Overall score
+    overall_score = _pluck(analysis_result, _OS_SCORE, _NA)
+    summary_parts.append(f"Overall Business Score: {overall_score}/100")
+
+    # Financial health
+    financial_health = analysis_result.get(_K_FINANCIAL_HEALTH, {})
+    if financial_health:
+        cash_runway = financial_health.get("cash_runway_months", _NA)
+        monthly_cash_flow = financial_health.get("monthly_cash_flow", _NA)
+        summary_parts.append(f"Financial Health: {financial_health.get('status', _NA)} (Cash runway: {cash_runway} months)")
+
+    # Market position
+    market_position = analysis_result.get(_K_MARKET_POSITION, {})
+    if market_position:
+        performance_ratio = market_position.get("performance_ratio", _NA)
+        try:
+            summary_parts.append(f"Market Performance: {performance_ratio:.1f}x industry average")
+        except (ValueError, TypeError):
+            summary_parts.append(f"Market Performance: {performance_ratio}")
+
+    # Growth analysis
+    growth_analysis = analysis_result.get(_K_GROWTH_ANALYSIS, {})
+    if growth_analysis:
+        growth_score = growth_analysis.get("growth_score", _NA)
+        summary_parts.append(f"Growth Potential: {growth_score}/100")
+
+    return "\n".join(summary_parts)
+
+
+def _format_financial_summary(business_data: Dict[str, Any], analysis_result: Dict[str, Any]) -> str:
+    """Format financial summary for prompts."""
+
+    current_revenue = _current_revenue(business_data)
+    monthly_expenses = business_data.get('monthly_expenses', 0)
+    current_cash = business_data.get('current_cash', 0)
+
+    financial_health = analysis_result.get(_K_FINANCIAL_HEALTH, {})
+
+    return ", ".join([
+        f"Revenue: ${current_revenue:,.0f}/month",
+        f"Expenses: ${monthly_expenses:,.0f}/month",
+        f"Cash: ${current_cash:,.0f}",
+        f"Health: {financial_health.get('status', _NA)}",
+    ])
+
+
+def _format_business_strengths(analysis_result: Dict[str, Any]) -> str:
+    """Format business strengths for prompts."""
+
+    overall_score = analysis_result.get(_K_OVERALL_SCORE, {})
+    strengths = overall_score.get("strengths", [])
+
+    if strengths:
+        return "Key Strengths:\n" + "\n".join([f"- {strength}" for strength in strengths])
+
+    return "Strengths analysis in progress"
+
+
+_MARKET_CONDITION_KEYS = ("sector_growth_rate", "competition_level", "market_sentiment")
+
+
+def _format_market_conditions(market_data: Dict[str, Any]) -> str:
+    """Format market conditions for prompts."""
+
+    if not market_data or not any(key in market_data for key in _MARKET_CONDITION_KEYS):
+        return "Limited market data available"
+
+    conditions = []
+
+    if "sector_growth_rate" in market_data:
+        sector_growth_pct = market_data["sector_growth_rate"] * 100
+        conditions.append(f"Sector Growth: {sector_growth_pct:.1f}%")
+
+    if "competition_level" in market_data:
+        conditions.append(f"Competition: {market_data['competition_level']}")
+
+    if "market_sentiment" in market_data:
+        conditions.append(f"Market Sentiment: {market_data['market_sentiment']}")
+
+    return "Market Conditions:\n" + "\n".join(f"- {condition}" for condition in conditions)
+
+
+def _format_performance_summary(analysis_result: Dict[str, Any]) -> str:
+    """Format performance summary for prompts."""
+
+    performance_metrics = analysis_result.get(_K_PERFORMANCE_METRICS, {})
+
+    parts = []
+
+    if "revenue_growth_rate" in performance_metrics:
+        growth_pct = performance_metrics["revenue_growth_rate"] * 100
+        parts.append(f"Revenue Growth: {growth_pct:.1f}%")
+
+    if "profit_margin" in performance_metrics:
+        margin_pct = performance_metrics["profit_margin"] * 100
+        parts.append(f"Profit Margin: {margin_pct:.1f}%")
+
+    if "financial_efficiency_score" in performance_metrics:
+        efficiency = performance_metrics["financial_efficiency_score"]
+        parts.append(f"Efficiency Score: {efficiency}/100")
+
+    return ", ".join(parts) if parts else "Performance data being analyzed"
+
+
+def _add_economic_context_to_prompt(economic_data: Dict[str, Any]) -> str:
+    """Add economic context section to prompts."""
+
+    if not economic_data:
+        return ""
+
+    values = (
+        economic_data.get('fed_funds_rate', _NA),
+        economic_data.get('inflation_cpi', _NA),
+        economic_data.get('unemployment_rate', _NA),
+        economic_data.get('consumer_confidence', _NA),
+        economic_data.get('economic_health_score', _NA),
+        _pluck(economic_data, _SBI_OVERALL, _NA),
+    )
+    try:
+        return _economic_context(*values)
+    except TypeError:
+        # Unhashable values (lists, dicts) cannot key the cache.
+        return _render_economic_context(*values)
+
+
+# Static JSON response schemas for the insight prompts. Only the header of each
+# prompt depends on request data, so the schema text is built and interned
+# once at import.
+_MAIN_INSIGHT_SCHEMA = sys.intern("""
+        {
             "title": "<compelling, specific insight title>",
             "main_message": "<clear, actionable main message in 2-3 sentences>",
             "supporting_facts": [
@@ -49,45 +264,20 @@ class InsightPromptTemplates:
                 "<strategic action with expected outcome>",
                 "<monitoring action with metrics>"
             ],
-            "potential_impact": {{
+            "potential_impact": {
                 "revenue_impact": "<potential $ impact or % improvement>",
                 "timeframe": "<timeline for impact>",
                 "probability": <0-100 success probability>
-                }},
+                },
            "confidence_level": <80-95 confidence score>
-       }}
+       }
        
        Focus on the highest-impact, most actionable insight that addresses the critical area.
        Include specific dollar amounts and percentages where possible.
-       """
-
-        return prompt
-   
-    def get_problem_insight_prompt(self, problem: Dict[str, Any], analysis_result: Dict[str, Any],
-                                  business_data: Dict[str, Any], economic_data: Dict[str, Any] = None) -> str:
-        """Generate prompt for problem-specific insights."""
-
-        prompt = f"""
-        EXPERT BUSINESS PROBLEM SOLVER ROLE:
-
-        Analyze this specific business problem and provide detailed insights for resolution.
-
-        PROBLEM IDENTIFIED: {problem['type']}
-        Problem Urgency: {problem.get('urgency', 'medium')}
-        Problem Severity: {problem.get('severity', 'medium')}
+       """)
 
-        BUSINESS CONTEXT:
-        - Sector: {business_data.get('sector', 'N/A')}
-        - Years Operating: {business_data.get('years_in_business', 0)}
-        - Current Financial State: {self._format_financial_summary(business_data, analysis_result)}
-
-        PROBLEM DATA:
-        {json.dumps(problem.get('data', {}), indent=2)}
-
-        {self._add_economic_context_to_prompt(economic_data) if economic_data else ""}
-
-        PROVIDE PROBLEM ANALYSIS IN JSON FORMAT:
-        {{
+_PROBLEM_INSIGHT_SCHEMA = sys.intern("""
+        {
             "title": "<specific problem statement>",
             "problem_description": "<detailed description of the problem and its manifestations>",
             "root_causes": [
@@ -95,19 +285,19 @@ class InsightPromptTemplates:
                 "<secondary root cause>",
                 "<systemic or external cause>"
             ],
-            "impact_analysis": {{
+            "impact_analysis": {
                 "current_impact": "<quantified current impact on business>",
                 "potential_future_impact": "<what happens if unaddressed>",
                 "affected_areas": ["<area 1>", "<area 2>", "<area 3>"]
-            }},
+            },
             "solution_approaches": [
-                {{
+                {
                     "approach": "<solution name>",
                     "description": "<how to implement>",
                     "investment_required": <dollar amount>,
                     "timeline": "<implementation timeline>",
                     "success_probability": <percentage>
-                }}
+                }
             ],
             "prevention_strategies": [
                 "<strategy to prevent recurrence>",
@@ -115,63 +305,36 @@ class InsightPromptTemplates:
                 "<early warning indicators>"
             ],
             "confidence_level": <75-90 confidence score>
-        }}
+        }
 
         Focus on practical, implementable solutions with specific costs and timelines.
-        """
-
-        return prompt
-    
-    def get_opportunity_insight_prompt(self, opportunity: Dict[str, Any], analysis_result: Dict[str, Any],
-                                     business_data: Dict[str, Any], economic_data: Dict[str, Any] = None,
-                                     market_data: Dict[str, Any] = None) -> str:
-        """Generate prompt for opportunity-specific insights."""
-
-        prompt = f"""
-        EXPERT GROWTH STRATEGIST ROLE:
-
-        Analyze this growth opportunity and provide detailed insights for capitalization.
+        """)
 
-        OPPORTUNITY IDENTIFIED: {opportunity['type']}
-        Opportunity Priority: {opportunity.get('priority', 'medium')}
-        Growth Potential: {opportunity.get('potential', 'medium')}
-
-        BUSINESS STRENGTHS TO LEVERAGE:
-        {self._format_business_strengths(analysis_result)}
-
-        MARKET CONDITIONS:
-        {self._format_market_conditions(market_data) if market_data else 'Limited market data available'}
-
-        OPPORTUNITY DATA:
-        {json.dumps(opportunity.get('data', {}), indent=2)}
-
-        {self._add_economic_context_to_prompt(economic_data) if economic_data else ""}
-
-        PROVIDE OPPORTUNITY ANALYSIS IN JSON FORMAT:
-        {{
+_OPPORTUNITY_INSIGHT_SCHEMA = sys.intern("""
+        {
             "title": "<compelling opportunity title>",
             "opportunity_description": "<detailed description of the opportunity and why it's viable>",
-            "market_potential": {{
+            "market_potential": {
                 "market_size": "<estimated market size or customer base>",
                 "growth_rate": "<market growth rate or trend>",
                 "competitive_intensity": "<competition level>",
                 "timing_favorability": "<why now is the right time>"
-            }},
+            },
             "implementation_strategy": [
-                {{
+                {
                     "phase": "<phase name>",
                     "actions": ["<action 1>", "<action 2>"],
                     "timeline": "<duration>",
                     "investment": <dollar amount>,
                     "expected_outcome": "<measurable outcome>"
-                }}
+                }
             ],
-            "resource_requirements": {{
+            "resource_requirements": {
                 "financial_investment": <total dollar amount>,
                 "human_resources": "<staffing needs>",
                 "operational_changes": "<required changes>",
                 "technology_needs": "<tech requirements>"
-            }},
+            },
             "timeline_to_value": "<time to see positive returns>",
             "success_probability": <percentage based on business strengths>,
             "competitive_advantages": [
@@ -180,46 +343,20 @@ class InsightPromptTemplates:
                 "<advantage 3>"
             ],
             "confidence_level": <75-90 confidence score>
-        }}
+        }
 
         Focus on realistic opportunities that align with business capabilities and market conditions.
-        """
-
-        return prompt
-    
-    def get_market_position_insight_prompt(self, business_data: Dict[str, Any],
-                                         market_data: Dict[str, Any],
-                                         economic_data: Dict[str, Any] = None) -> str:
-        """Generate prompt for market position insights."""
-
-        current_revenue = business_data.get('monthly_revenue', [0])[-1] if business_data.get('monthly_revenue') else 0
-
-        prompt = f"""
-        EXPERT MARKET ANALYST ROLE:
+        """)
 
-        Analyze this US small business market position and provide strategic positioning insights.
-
-        BUSINESS MARKET PROFILE:
-        - Sector: {business_data.get('sector', 'N/A')}
-        - Location: {business_data.get('location', 'N/A')}
-        - Current Revenue: ${current_revenue:,.0f}/month
-        - Business Model: {business_data.get('business_type', 'N/A')}
-        - Market Experience: {business_data.get('years_in_business', 0)} years
-
-        MARKET DATA:
-        {json.dumps(market_data, indent=2) if market_data else 'Limited market data available'}
-
-        {self._add_economic_context_to_prompt(economic_data) if economic_data else ""}
-
-        PROVIDE MARKET POSITION ANALYSIS IN JSON FORMAT:
-        {{
+_MARKET_POSITION_INSIGHT_SCHEMA = sys.intern("""
+        {
             "title": "<market position summary>",
-            "position_analysis": {{
+            "position_analysis": {
                 "current_position": "<where business stands in market>",
                 "market_share_estimate": "<estimated market share>",
                 "competitive_ranking": "<ranking among competitors>",
                 "differentiation_level": "<how differentiated from competitors>"
-            }},
+            },
             "competitive_dynamics": [
                 "<key competitive force 1>",
                 "<key competitive force 2>",
@@ -233,53 +370,28 @@ class InsightPromptTemplates:
                 "<technology/regulatory changes>"
             ],
             "positioning_recommendations": [
-                {{
+                {
                     "strategy": "<positioning strategy>",
                     "rationale": "<why this positioning works>",
                     "implementation": "<how to achieve this positioning>",
                     "timeline": "<timeline for positioning shift>"
-                }}
+                }
             ],
             "confidence_level": <80-90 confidence score>
-        }}
+        }
 
         Focus on actionable positioning strategies that leverage business strengths.
-        """
+        """)
 
-        return prompt
-    
-    def get_economic_impact_insight_prompt(self, business_data: Dict[str, Any],
-                                         economic_data: Dict[str, Any]) -> str:
-        """Generate prompt for economic impact insights."""
-
-        prompt = f"""
-        EXPERT ECONOMIC ANALYST ROLE:
-
-        Analyze how current US economic conditions specifically impact this small business.
-
-        BUSINESS PROFILE:
-        - Sector: {business_data.get('sector', 'N/A')}
-        - Business Model: {business_data.get('business_type', 'N/A')}
-        - Customer Base: {business_data.get('primary_customers', 'N/A')}
-        - Location: {business_data.get('location', 'N/A')}
-
-        CURRENT US ECONOMIC CONDITIONS:
-        - Fed Funds Rate: {economic_data.get('fed_funds_rate', 'N/A')}%
-        - Inflation Rate: {economic_data.get('inflation_cpi', 'N/A')}
-        - Unemployment Rate: {economic_data.get('unemployment_rate', 'N/A')}%
-        - Consumer Confidence: {economic_data.get('consumer_confidence', 'N/A')}
-        - Small Business Optimism: {economic_data.get('small_business_optimism', 'N/A')}
-        - Economic Health Score: {economic_data.get('economic_health_score', 'N/A')}/100
-
-        PROVIDE ECONOMIC IMPACT ANALYSIS IN JSON FORMAT:
-        {{
+_ECONOMIC_IMPACT_INSIGHT_SCHEMA = sys.intern("""
+        {
             "title": "<economic impact summary>",
-            "impact_analysis": {{
+            "impact_analysis": {
                 "overall_impact": "<positive/negative/mixed/neutral>",
                 "impact_magnitude": "<high/medium/low>",
                 "primary_impact_channels": ["<channel 1>", "<channel 2>", "<channel 3>"],
                 "quantified_impact": "<estimated $ or % impact>"
-            }},
+            },
             "sector_implications": [
                 "<how Fed rates affect this sector>",
                 "<how inflation affects costs/pricing>",
@@ -287,81 +399,56 @@ class InsightPromptTemplates:
                 "<consumer confidence impact on purchases>"
             ],
             "adaptation_strategies": [
-                {{
+                {
                     "strategy": "<adaptation approach>",
                     "economic_scenario": "<which conditions this addresses>",
                     "implementation_cost": <dollar amount>,
                     "expected_benefit": "<quantified benefit>"
-                }}
+                }
             ],
-            "timing_considerations": {{
+            "timing_considerations": {
                 "immediate_actions": ["<action 1>", "<action 2>"],
                 "if_conditions_worsen": ["<defensive action 1>", "<defensive action 2>"],
                 "if_conditions_improve": ["<growth action 1>", "<growth action 2>"],
                 "monitoring_indicators": ["<indicator 1>", "<indicator 2>"]
-            }},
+            },
             "confidence_level": <85-95 confidence score>
-        }}
+        }
 
         Focus on specific, actionable adaptations to current economic conditions.
-        """
-
-        return prompt
-    
-    def get_growth_strategy_insight_prompt(self, analysis_result: Dict[str, Any],
-                                         business_data: Dict[str, Any],
-                                         economic_data: Dict[str, Any] = None) -> str:
-        """Generate prompt for growth strategy insights."""
-
-        prompt = f"""
-        EXPERT GROWTH STRATEGIST ROLE:
+        """)
 
-        Develop comprehensive growth strategy insights for this US small business.
-
-        BUSINESS GROWTH PROFILE:
-        - Current Performance: {self._format_performance_summary(analysis_result)}
-        - Growth Potential Score: {analysis_result.get('growth_analysis', {}).get('growth_score', 'N/A')}/100
-        - Market Position: {analysis_result.get('market_position', {}).get('performance_category', 'N/A')}
-        - Financial Capacity: {analysis_result.get('financial_health', {}).get('status', 'N/A')}
-
-        BUSINESS CAPABILITIES:
-        - Years Experience: {business_data.get('years_in_business', 0)}
-        - Team Size: {business_data.get('employees_count', 0)}
-        - Sector Expertise: {business_data.get('sector', 'N/A')}
-
-        {self._add_economic_context_to_prompt(economic_data) if economic_data else ""}
-
-        PROVIDE GROWTH STRATEGY ANALYSIS IN JSON FORMAT:
-        {{
+_GROWTH_STRATEGY_INSIGHT_SCHEMA = sys.intern("""
+        {
             "title": "<growth strategy direction>",
-            "strategy_analysis": {{
+            "strategy_analysis": {
                 "growth_readiness": "<ready/partially_ready/not_ready>",
                 "optimal_growth_vector": "<organic/acquisition/partnership/expansion>",
                 "growth_timing": "<immediate/short_term/medium_term>",
                 "growth_constraints": ["<constraint 1>", "<constraint 2>"]
-            }},
+            },
             "growth_vectors": [
-                {{
+                {
                     "vector": "<growth approach>",
                     "potential_impact": "<revenue/market impact>",
                     "resource_requirement": <dollar amount>,
                     "timeline": "<implementation timeline>",
                     "success_probability": <percentage>
-                }}
+                }
             ],
-            "resource_allocation": {{
+            "resource_allocation": {
                 "current_operations": <percentage>,
                 "growth_investments": <percentage>,
                 "market_expansion": <percentage>,
                 "capability_building": <percentage>
-            }},
+            },
             "milestone_framework": [
-                {{
+                {
                     "milestone": "<specific milestone>",
                     "timeline": "<when to achieve>",
                     "success_metric": "<how to measure>",
                     "investment_required": <dollar amount>
-                }}
+                }
             ],
             "risk_considerations": [
                 "<growth risk 1>",
@@ -369,57 +456,35 @@ class InsightPromptTemplates:
                 "<mitigation approach>"
             ],
             "confidence_level": <80-90 confidence score>
-        }}
+        }
 
         Focus on realistic, fundable growth strategies aligned with business capabilities.
-        """
-
-        return prompt
-    
-    def get_competitive_strategy_insight_prompt(self, analysis_result: Dict[str, Any],
-                                              business_data: Dict[str, Any]) -> str:
-        """Generate prompt for competitive strategy insights."""
-
-        prompt = f"""
-        EXPERT COMPETITIVE STRATEGIST ROLE:
+        """)
 
-        Develop competitive strategy insights for this US small business.
-
-        COMPETITIVE POSITION:
-        - Market Performance: {analysis_result.get('market_position', {}).get('performance_category', 'N/A')}
-        - Competitive Strengths: {analysis_result.get('competitive_analysis', {}).get('competitive_strengths', [])}
-        - Competitive Weaknesses: {analysis_result.get('competitive_analysis', {}).get('competitive_weaknesses', [])}
-        - Market Share: {analysis_result.get('competitive_analysis', {}).get('estimated_market_share', 'N/A')}%
-
-        BUSINESS ASSETS:
-        - Experience: {business_data.get('years_in_business', 0)} years in market
-        - Sector: {business_data.get('sector', 'N/A')}
-        - Customer Base: {business_data.get('primary_customers', 'N/A')}
-
-        PROVIDE COMPETITIVE STRATEGY ANALYSIS IN JSON FORMAT:
-        {{
+_COMPETITIVE_STRATEGY_INSIGHT_SCHEMA = sys.intern("""
+        {
             "title": "<competitive strategy framework>",
-            "competitive_analysis": {{
+            "competitive_analysis": {
                 "competitive_position": "<leader/challenger/follower/niche>",
                 "key_differentiators": ["<differentiator 1>", "<differentiator 2>"],
                 "competitive_gaps": ["<gap 1>", "<gap 2>"],
                 "sustainable_advantages": ["<advantage 1>", "<advantage 2>"]
-            }},
+            },
             "differentiation_opportunities": [
-                {{
+                {
                     "opportunity": "<differentiation approach>",
                     "implementation": "<how to achieve>",
                     "investment": <dollar amount>,
                     "competitive_moat": "<how sustainable>"
-                }}
+                }
             ],
             "competitive_moves": [
-                {{
+                {
                     "move": "<strategic move>",
                     "objective": "<what this achieves>",
                     "execution": "<how to execute>",
                     "expected_response": "<competitor likely response>"
-                }}
+                }
             ],
             "defensive_strategies": [
                 "<defensive strategy 1>",
@@ -427,177 +492,23 @@ class InsightPromptTemplates:
                 "<customer retention approach>"
             ],
             "confidence_level": <75-85 confidence score>
-        }}
+        }
 
         Focus on practical competitive strategies that small businesses can execute effectively.
-        """
-
-        return prompt
-    
-    def _format_analysis_summary(self, analysis_result: Dict[str, Any]) -> str:
-        """Format analysis results into readable summary."""
-
-        summary_parts = []
-
-        # Overall score
-        overall_score = analysis_result.get("overall_score", {}).get("overall_score", "N/A")
-        summary_parts.append(f"Overall Business Score: {overall_score}/100")
-
-        # Financial health
-        financial_health = analysis_result.get("financial_health", {})
-        if financial_health:
-            cash_runway = financial_health.get("cash_runway_months", "N/A")
-            monthly_cash_flow = financial_health.get("monthly_cash_flow", "N/A")
-            summary_parts.append(f"Financial Health: {financial_health.get('status', 'N/A')} (Cash runway: {cash_runway} months)")
-
-        # Market position
-        market_position = analysis_result.get("market_position", {})
-        if market_position:
-            performance_ratio = market_position.get("performance_ratio", "N/A")
-            summary_parts.append(f"Market Performance: {performance_ratio:.1f}x industry average" if isinstance(performance_ratio, (int, float)) else f"Market Performance: {performance_ratio}")
-
-        # Growth analysis
-        growth_analysis = analysis_result.get("growth_analysis", {})
-        if growth_analysis:
-            growth_score = growth_analysis.get("growth_score", "N/A")
-            summary_parts.append(f"Growth Potential: {growth_score}/100")
-
-        return "\n".join(summary_parts)
-    
-    def _format_financial_summary(self, business_data: Dict[str, Any], analysis_result: Dict[str, Any]) -> str:
-        """Format financial summary for prompts."""
-
-        current_revenue = business_data.get('monthly_revenue', [0])[-1] if business_data.get('monthly_revenue') else 0
-        monthly_expenses = business_data.get('monthly_expenses', 0)
-        current_cash = business_data.get('current_cash', 0)
-
-        financial_health = analysis_result.get("financial_health", {})
-
-        return (f"Revenue: ${current_revenue:,.0f}/month, "
-                f"Expenses: ${monthly_expenses:,.0f}/month, "
-                f"Cash: ${current_cash:,.0f}, "
-                f"Health: {financial_health.get('status', 'N/A')}")
-    
-    def _format_business_strengths(self, analysis_result: Dict[str, Any]) -> str:
-        """Format business strengths for prompts."""
-
-        overall_score = analysis_result.get("overall_score", {})
-        strengths = overall_score.get("strengths", [])
-
-        if strengths:
-            return "Key Strengths:\n" + "\n".join(f"- {strength}" for strength in strengths)
-
-        return "Strengths analysis in progress"
-    
-    def _format_market_conditions(self, market_data: Dict[str, Any]) -> str:
-        """Format market conditions for prompts."""
-
-        if not market_data:
-            return "Limited market data available"
-
-        conditions = []
-
-        if "sector_growth_rate" in market_data:
-            conditions.append(f"Sector Growth: {market_data['sector_growth_rate']*100:.1f}%")
-
-        if "competition_level" in market_data:
-            conditions.append(f"Competition: {market_data['competition_level']}")
-
-        if "market_sentiment" in market_data:
-            conditions.append(f"Market Sentiment: {market_data['market_sentiment']}")
-
-        return "Market Conditions:\n" + "\n".join(f"- {condition}" for condition in conditions)
-    
-    def _format_performance_summary(self, analysis_result: Dict[str, Any]) -> str:
-        """Format performance summary for prompts."""
-
-        performance_metrics = analysis_result.get("performance_metrics", {})
-
-        parts = []
+        """)
 
-        if "revenue_growth_rate" in performance_metrics:
-            growth_rate = performance_metrics["revenue_growth_rate"]
-            parts.append(f"Revenue Growth: {growth_rate*100:.1f}%")
-
-        if "profit_margin" in performance_metrics:
-            profit_margin = performance_metrics["profit_margin"]
-            parts.append(f"Profit Margin: {profit_margin*100:.1f}%")
-
-        if "financial_efficiency_score" in performance_metrics:
-            efficiency = performance_metrics["financial_efficiency_score"]
-            parts.append(f"Efficiency Score: {efficiency}/100")
-
-        return ", ".join(parts) if parts else "Performance data being analyzed"
-    
-    def _add_economic_context_to_prompt(self, economic_data: Dict[str, Any]) -> str:
-        """Add economic context section to prompts."""
-
-        if not economic_data:
-            return ""
-
-        context = f"""
-        CURRENT US ECONOMIC ENVIRONMENT:
-        - Federal Funds Rate: {economic_data.get('fed_funds_rate', 'N/A')}%
-        - Inflation (CPI): {economic_data.get('inflation_cpi', 'N/A')}
-        - Unemployment Rate: {economic_data.get('unemployment_rate', 'N/A')}%
-        - Consumer Confidence: {economic_data.get('consumer_confidence', 'N/A')}
-        - Economic Health Score: {economic_data.get('economic_health_score', 'N/A')}/100
-        - Small Business Climate: {economic_data.get('small_business_impact', {}).get('overall_impact', 'N/A')}
-        """
-
-        return context
-
-
-class BusinessAnalysisPromptTemplates:
-   """Prompt templates for comprehensive business analysis."""
-   
-   @staticmethod
-   def get_comprehensive_analysis_prompt(business_data: Dict[str, Any], 
-                                       economic_data: Dict[str, Any],
-                                       market_data: Dict[str, Any]) -> str:
-       """Generate comprehensive business analysis prompt."""
-       
-       current_revenue = business_data.get('monthly_revenue', [0])[-1] if business_data.get('monthly_revenue') else 0
-       
-       return f"""
+# Static sections of the comprehensive analysis prompt, joined with the
+# per-business fields in get_comprehensive_analysis_prompt.
+_COMPREHENSIVE_ANALYSIS_PREAMBLE = sys.intern("""
        EXPERT US SMALL BUSINESS ANALYST ROLE:
        
        Conduct comprehensive analysis of this US small business with current economic and market context.
        
        BUSINESS PROFILE:
-       - Business Name: {business_data.get('business_name', 'US Small Business')}
-       - Industry Sector: {business_data.get('sector', 'N/A')}
-       - Location: {business_data.get('location', 'N/A')}
-       - Business Type: {business_data.get('business_type', 'N/A')}
-       - Years in Operation: {business_data.get('years_in_business', 0)}
-       - Employee Count: {business_data.get('employees_count', 0)}
-       
-       FINANCIAL DATA (Last 6 Months):
-       - Monthly Revenue: {business_data.get('monthly_revenue', [])}
-       - Monthly Expenses: ${business_data.get('monthly_expenses', 0):,.0f}
-       - Current Cash Position: ${business_data.get('current_cash', 0):,.0f}
-       - Current Monthly Revenue: ${current_revenue:,.0f}
-       
-       OPERATIONAL CONTEXT:
-       - Primary Customer Type: {business_data.get('primary_customers', 'N/A')}
-       - Main Business Challenges: {business_data.get('main_challenges', [])}
-       - Business Goals: {business_data.get('business_goals', [])}
-       
-       CURRENT US ECONOMIC ENVIRONMENT:
-       - Fed Funds Rate: {economic_data.get('fed_funds_rate', 'N/A')}%
-       - Inflation Rate (CPI): {economic_data.get('inflation_cpi', 'N/A')}
-       - Unemployment Rate: {economic_data.get('unemployment_rate', 'N/A')}%
-       - Consumer Confidence Index: {economic_data.get('consumer_confidence', 'N/A')}
-       - Small Business Optimism Index: {economic_data.get('small_business_optimism', 'N/A')}
-       - GDP Growth Rate: {economic_data.get('gdp_growth', 'N/A')}%
-       - Economic Health Score: {economic_data.get('economic_health_score', 'N/A')}/100
-       
-       MARKET CONDITIONS:
-       {json.dumps(market_data, indent=2) if market_data else 'Market data being analyzed'}
-       
-       PROVIDE COMPREHENSIVE ANALYSIS IN JSON FORMAT:
-       {{
-           "executive_summary": {{
+""")
+_COMPREHENSIVE_ANALYSIS_SCHEMA = sys.intern("""
+       {
+           "executive_summary": {
                "overall_health_score": <0-100>,
                "business_stage": "<startup/growth/mature/declining>",
                "competitive_position": "<leader/strong/average/weak>",
@@ -605,8 +516,8 @@ class BusinessAnalysisPromptTemplates:
                "growth_trajectory": "<accelerating/steady/slowing/declining>",
                "economic_sensitivity": "<low/medium/high>",
                "key_message": "<one sentence executive summary>"
-           }},
-           "financial_analysis": {{
+           },
+           "financial_analysis": {
                "revenue_trend": "<increasing/stable/declining>",
                "revenue_growth_rate": <monthly growth rate as decimal>,
                "profit_margin": <percentage as decimal>,
@@ -614,36 +525,36 @@ class BusinessAnalysisPromptTemplates:
                "liquidity_score": <0-100>,
                "financial_health_grade": "<A/B/C/D/F>",
                "burn_rate": <monthly cash burn>,
-               "break_even_analysis": {{
+               "break_even_analysis": {
                    "current_break_even": <monthly revenue needed>,
                    "break_even_gap": <difference from current>
-               }}
-           }},
-           "market_position": {{
+               }
+           },
+           "market_position": {
                "market_performance_ratio": <ratio vs industry average>,
                "percentile_rank": <0-100 percentile>,
                "competitive_advantages": ["<advantage 1>", "<advantage 2>"],
                "competitive_disadvantages": ["<disadvantage 1>", "<disadvantage 2>"],
                "market_share_estimate": <percentage>,
                "differentiation_level": "<high/medium/low>"
-           }},
-           "economic_impact_assessment": {{
+           },
+           "economic_impact_assessment": {
                "interest_rate_sensitivity": "<high/medium/low>",
                "inflation_impact": "<positive/negative/neutral>",
                "consumer_confidence_correlation": "<strong/moderate/weak>",
                "recession_resilience": "<high/medium/low>",
                "economic_tailwinds": ["<tailwind 1>", "<tailwind 2>"],
                "economic_headwinds": ["<headwind 1>", "<headwind 2>"]
-           }},
-           "growth_analysis": {{
+           },
+           "growth_analysis": {
                "organic_growth_potential": <0-100 score>,
                "scalability_assessment": "<high/medium/low>",
                "growth_constraints": ["<constraint 1>", "<constraint 2>"],
                "expansion_readiness": "<ready/partial/not_ready>",
                "recommended_growth_strategy": "<strategy name>",
                "growth_investment_needed": <dollar amount>
-           }},
-           "risk_assessment": {{
+           },
+           "risk_assessment": {
                "overall_risk_score": <0-100>,
                "financial_risk": <0-100>,
                "market_risk": <0-100>,
@@ -651,9 +562,9 @@ class BusinessAnalysisPromptTemplates:
                "economic_risk": <0-100>,
                "top_risks": ["<risk 1>", "<risk 2>", "<risk 3>"],
                "risk_mitigation_priority": "<high/medium/low>"
-           }},
+           },
            "strategic_recommendations": [
-               {{
+               {
                    "category": "<financial/operational/marketing/strategic>",
                    "recommendation": "<specific recommendation>",
                    "priority": "<high/medium/low>",
@@ -661,82 +572,61 @@ class BusinessAnalysisPromptTemplates:
                    "investment_required": <dollar amount>,
                    "expected_roi": <percentage or dollar amount>,
                    "implementation_difficulty": "<low/medium/high>"
-               }}
+               }
            ],
-           "performance_projections": {{
+           "performance_projections": {
                "3_month_revenue_forecast": <dollar amount>,
                "6_month_revenue_forecast": <dollar amount>,
                "12_month_revenue_forecast": <dollar amount>,
-               "confidence_intervals": {{
+               "confidence_intervals": {
                    "best_case": <percentage above forecast>,
                    "worst_case": <percentage below forecast>
-               }}
-           }},
-           "investment_recommendations": {{
+               }
+           },
+           "investment_recommendations": {
                "available_investment_capital": <dollar amount>,
-               "recommended_allocation": {{
+               "recommended_allocation": {
                    "business_reinvestment": <percentage>,
                    "emergency_fund": <percentage>,
                    "market_investments": <percentage>,
                    "growth_opportunities": <percentage>
-               }},
+               },
                "specific_investment_opportunities": [
-                   {{
+                   {
                        "opportunity": "<investment opportunity>",
                        "amount": <dollar amount>,
                        "expected_return": <percentage>,
                        "risk_level": "<low/medium/high>"
-                   }}
+                   }
                ]
-           }},
-           "next_steps": {{
+           },
+           "next_steps": {
                "immediate_actions": ["<action 1>", "<action 2>", "<action 3>"],
                "30_day_goals": ["<goal 1>", "<goal 2>"],
                "90_day_objectives": ["<objective 1>", "<objective 2>"],
                "monitoring_metrics": ["<metric 1>", "<metric 2>", "<metric 3>"]
-           }},
+           },
            "confidence_level": <80-95 overall confidence in analysis>
-       }}
+       }
        
        Ensure all financial figures are realistic and all recommendations are specific and actionable.
        Focus on practical strategies appropriate for US small businesses in the current economic environment.
-       """
+       """)
 
 
-class RecommendationPromptTemplates:
-   """Prompt templates for generating business recommendations."""
-   
-   @staticmethod
-   def get_immediate_actions_prompt(analysis_result: Dict[str, Any],
-                                  business_data: Dict[str, Any],
-                                  economic_data: Dict[str, Any]) -> str:
-       """Generate prompt for immediate action recommendations."""
-       
-       return f"""
-       EXPERT BUSINESS ADVISOR ROLE:
-       
-       Based on comprehensive business analysis, generate immediate action recommendations for this US small business.
-       
-       CRITICAL SITUATION SUMMARY:
-       - Overall Business Score: {analysis_result.get('overall_score', {}).get('overall_score', 'N/A')}/100
-       - Financial Health: {analysis_result.get('financial_health', {}).get('status', 'N/A')}
-       - Cash Runway: {analysis_result.get('financial_health', {}).get('cash_runway_months', 'N/A')} months
-       - Market Performance: {analysis_result.get('market_position', {}).get('performance_category', 'N/A')}
-       - Risk Level: {analysis_result.get('risk_assessment', {}).get('risk_level', 'N/A')}
-       
-       BUSINESS CONSTRAINTS:
-       - Available Cash: ${business_data.get('current_cash', 0):,.0f}
-       - Monthly Expenses: ${business_data.get('monthly_expenses', 0):,.0f}
-       - Team Size: {business_data.get('employees_count', 0)} employees
-       
-       ECONOMIC URGENCY FACTORS:
-       - Fed Rate Impact: {economic_data.get('small_business_impact', {}).get('financing_cost_impact', 'N/A')}
-       - Economic Environment: {economic_data.get('small_business_impact', {}).get('overall_impact', 'N/A')}
-       
-       GENERATE IMMEDIATE ACTION PLAN (NEXT 30 DAYS) IN JSON FORMAT:
-       {{
+_VERY_CONSERVATIVE = sys.intern("very_conservative")
+_CONSERVATIVE = sys.intern("conservative")
+_MODERATE = sys.intern("moderate")
+_AGGRESSIVE = sys.intern("aggressive")
+_BALANCED = sys.intern("balanced")
+
+
+# Static JSON response schemas for the recommendation and action plan
+# prompts, appended to the per-request header of each builder.
+_IMMEDIATE_ACTIONS_SCHEMA = sys.intern("""
+       {
            "critical_actions": [
-               {{
+               {
                    "action": "<specific action to take>",
                    "urgency": "<critical/high/medium>",
                    "timeline": "<specific deadline>",
@@ -744,84 +634,57 @@ class RecommendationPromptTemplates:
                    "expected_outcome": "<measurable result>",
                    "implementation_steps": ["<step 1>", "<step 2>", "<step"step 3>"],
                   "success_metric": "<how to measure success>"
-              }}
+              }
           ],
           "financial_stabilization": [
-              {{
+              {
                   "action": "<cash flow improvement action>",
                   "impact": <dollar amount improvement>,
                   "timeline": "<implementation time>",
                   "difficulty": "<easy/medium/hard>",
                   "resources_needed": ["<resource 1>", "<resource 2>"]
-              }}
+              }
           ],
           "operational_improvements": [
-              {{
+              {
                   "improvement": "<specific operational change>",
                   "cost_savings": <annual dollar savings>,
                   "implementation_cost": <upfront cost>,
                   "payback_period": "<time to break even>",
                   "priority": "<high/medium/low>"
-              }}
+              }
           ],
           "risk_mitigation": [
-              {{
+              {
                   "risk": "<specific risk to address>",
                   "mitigation_action": "<action to take>",
                   "cost": <implementation cost>,
                   "risk_reduction": "<percentage risk reduction>"
-              }}
+              }
           ],
           "quick_wins": [
-              {{
+              {
                   "action": "<easy to implement action>",
                   "benefit": "<specific benefit>",
                   "timeline": "<days to complete>",
                   "effort_required": "<low/medium/high>"
-              }}
+              }
           ],
           "monitoring_checklist": [
               "<daily metric to track>",
               "<weekly review item>",
               "<monthly assessment>"
           ]
-      }}
+      }
       
       Focus on actions that can be implemented immediately with available resources.
       Prioritize cash flow improvement and risk reduction given current economic conditions.
-      """
+      """)
 
-   @staticmethod
-   def get_strategic_actions_prompt(analysis_result: Dict[str, Any],
-                                  business_data: Dict[str, Any],
-                                  economic_data: Dict[str, Any]) -> str:
-       """Generate prompt for strategic action recommendations."""
-       
-       return f"""
-       EXPERT STRATEGIC BUSINESS CONSULTANT ROLE:
-       
-       Develop strategic action recommendations (3-12 month horizon) for this US small business.
-       
-       STRATEGIC CONTEXT:
-       - Business Maturity: {business_data.get('years_in_business', 0)} years in operation
-       - Growth Potential: {analysis_result.get('growth_analysis', {}).get('growth_score', 'N/A')}/100
-       - Market Position: {analysis_result.get('market_position', {}).get('performance_category', 'N/A')}
-       - Expansion Readiness: {analysis_result.get('growth_analysis', {}).get('expansion_readiness', {}).get('readiness_level', 'N/A')}
-       
-       INVESTMENT CAPACITY:
-       - Available Capital: ${business_data.get('current_cash', 0):,.0f}
-       - Monthly Cash Generation: ${analysis_result.get('financial_health', {}).get('monthly_cash_flow', 0):,.0f}
-       - Debt Capacity: ${analysis_result.get('financial_health', {}).get('debt_capacity', 0):,.0f}
-       
-       ECONOMIC STRATEGIC FACTORS:
-       - Economic Environment: {economic_data.get('small_business_impact', {}).get('overall_impact', 'N/A')}
-       - Interest Rate Environment: {economic_data.get('fed_funds_rate', 'N/A')}%
-       - Business Climate Score: {economic_data.get('business_climate_score', 'N/A')}/100
-       
-       GENERATE STRATEGIC ACTION PLAN IN JSON FORMAT:
-       {{
+_STRATEGIC_ACTIONS_SCHEMA = sys.intern("""
+       {
            "growth_initiatives": [
-               {{
+               {
                    "initiative": "<specific growth strategy>",
                    "objective": "<measurable goal>",
                    "timeline": "<3-12 months>",
@@ -830,151 +693,120 @@ class RecommendationPromptTemplates:
                    "success_probability": <percentage>,
                    "market_timing": "<excellent/good/fair/poor>",
                    "implementation_phases": [
-                       {{
+                       {
                            "phase": "<phase name>",
                            "duration": "<months>",
                            "investment": <dollar amount>,
                            "milestones": ["<milestone 1>", "<milestone 2>"]
-                       }}
+                       }
                    ]
-               }}
+               }
            ],
            "market_positioning": [
-               {{
+               {
                    "strategy": "<positioning strategy>",
                    "target_market": "<specific target>",
                    "competitive_advantage": "<key differentiator>",
                    "marketing_investment": <dollar amount>,
                    "timeline_to_impact": "<months>",
                    "success_metrics": ["<metric 1>", "<metric 2>"]
-               }}
+               }
            ],
            "operational_scaling": [
-               {{
+               {
                    "area": "<operations/technology/people/processes>",
                    "improvement": "<specific enhancement>",
                    "capacity_increase": "<percentage improvement>",
                    "investment": <dollar amount>,
                    "roi_timeline": "<months to payback>",
                    "implementation_complexity": "<low/medium/high>"
-               }}
+               }
            ],
            "financial_optimization": [
-               {{
+               {
                    "strategy": "<financial strategy>",
                    "objective": "<specific financial goal>",
                    "annual_impact": <dollar amount>,
                    "implementation_cost": <dollar amount>,
                    "risk_level": "<low/medium/high>",
                    "regulatory_considerations": ["<consideration 1>", "<consideration 2>"]
-               }}
+               }
            ],
            "technology_investments": [
-               {{
+               {
                    "technology": "<specific technology>",
                    "business_benefit": "<operational improvement>",
                    "cost": <implementation cost>,
                    "annual_savings": <dollar savings>,
                    "competitive_advantage": "<advantage gained>",
                    "implementation_timeline": "<months>"
-               }}
+               }
            ],
            "strategic_partnerships": [
-               {{
+               {
                    "partnership_type": "<supplier/distributor/strategic>",
                    "objective": "<partnership goal>",
                    "potential_partners": ["<partner type 1>", "<partner type 2>"],
                    "expected_benefit": "<quantified benefit>",
                    "timeline_to_establish": "<months>"
-               }}
+               }
            ],
            "risk_management": [
-               {{
+               {
                    "strategic_risk": "<long-term risk>",
                    "mitigation_strategy": "<comprehensive strategy>",
                    "investment_required": <dollar amount>,
                    "timeline": "<implementation period>",
                    "risk_reduction": "<percentage reduction>"
-               }}
+               }
            ],
-           "success_framework": {{
+           "success_framework": {
                "quarterly_milestones": ["<Q1 milestone>", "<Q2 milestone>", "<Q3 milestone>", "<Q4 milestone>"],
                "key_performance_indicators": ["<KPI 1>", "<KPI 2>", "<KPI 3>"],
                "review_schedule": "<monthly/quarterly review process>",
                "adjustment_triggers": ["<trigger 1>", "<trigger 2>"]
-           }}
-       }}
+           }
+       }
        
        Focus on strategies that build sustainable competitive advantages and long-term value.
        Consider current economic conditions and their impact on strategy timing and execution.
-       """
+       """)
 
-   @staticmethod
-   def get_investment_recommendations_prompt(analysis_result: Dict[str, Any],
-                                           business_data: Dict[str, Any],
-                                           economic_data: Dict[str, Any]) -> str:
-       """Generate prompt for investment recommendations."""
-       
-       available_capital = max(0, business_data.get('current_cash', 0) - (business_data.get('monthly_expenses', 0) * 3))
-       
-       return f"""
-       EXPERT SMALL BUSINESS INVESTMENT ADVISOR ROLE:
-       
-       Provide comprehensive investment recommendations for this US small business owner.
-       
-       INVESTOR PROFILE:
-       - Business Owner with {business_data.get('years_in_business', 0)} years experience
-       - Sector Expertise: {business_data.get('sector', 'N/A')}
-       - Available Investment Capital: ${available_capital:,.0f}
-       - Monthly Business Cash Flow: ${analysis_result.get('financial_health', {}).get('monthly_cash_flow', 0):,.0f}
-       - Risk Tolerance: {RecommendationPromptTemplates._assess_risk_tolerance(analysis_result, business_data)}
-       
-       BUSINESS INVESTMENT CAPACITY:
-       - Cash Position: ${business_data.get('current_cash', 0):,.0f}
-       - Debt Capacity: ${analysis_result.get('financial_health', {}).get('debt_capacity', 0):,.0f}
-       - Business Health Score: {analysis_result.get('financial_health', {}).get('health_score', 'N/A')}/100
-       
-       CURRENT ECONOMIC ENVIRONMENT:
-       - Fed Funds Rate: {economic_data.get('fed_funds_rate', 'N/A')}%
-       - Inflation Rate: {economic_data.get('inflation_cpi', 'N/A')}
-       - Market Conditions: {economic_data.get('small_business_impact', {}).get('overall_impact', 'N/A')}
-       - Bond Yields: Estimated {(economic_data.get('fed_funds_rate', 5) + 1):.1f}% for 10-year Treasury
-       
-       PROVIDE INVESTMENT RECOMMENDATIONS IN JSON FORMAT:
-       {{
-           "investment_strategy": {{
+_INVESTMENT_RECOMMENDATIONS_SCHEMA = sys.intern("""
+       {
+           "investment_strategy": {
                "overall_approach": "<conservative/balanced/growth/aggressive>",
                "time_horizon": "<short/medium/long term focus>",
                "diversification_principle": "<strategy description>",
                "risk_management": "<risk management approach>"
-           }},
-           "asset_allocation": {{
-               "business_reinvestment": {{
+           },
+           "asset_allocation": {
+               "business_reinvestment": {
                    "percentage": <percentage of available capital>,
                    "amount": <dollar amount>,
                    "rationale": "<why this allocation>",
                    "expected_return": <percentage annual return>
-               }},
-               "emergency_reserve": {{
+               },
+               "emergency_reserve": {
                    "percentage": <percentage>,
                    "amount": <dollar amount>,
                    "vehicle": "<high-yield savings/money market>",
                    "target_months_coverage": <months of expenses>
-               }},
-               "market_investments": {{
+               },
+               "market_investments": {
                    "percentage": <percentage>,
                    "amount": <dollar amount>,
                    "risk_level": "<conservative/moderate/aggressive>",
                    "expected_annual_return": <percentage>
-               }},
-               "alternative_investments": {{
+               },
+               "alternative_investments": {
                    "percentage": <percentage>,
                    "amount": <dollar amount>,
                    "types": ["<investment type 1>", "<investment type 2>"]
-               }}
-           }},
+               }
+           },
            "specific_recommendations": [
-               {{
+               {
                    "investment_type": "<stocks/bonds/ETFs/business_expansion/real_estate>",
                    "allocation_amount": <dollar amount>,
                    "specific_vehicles": ["<specific investment 1>", "<specific investment 2>"],
@@ -983,142 +815,69 @@ class RecommendationPromptTemplates:
                    "risk_level": "<low/medium/high>",
                    "liquidity": "<high/medium/low>",
                    "tax_implications": "<tax considerations>"
-               }}
+               }
            ],
            "sector_specific_investments": [
-               {{
+               {
                    "investment": "<sector-related investment opportunity>",
                    "amount": <dollar amount>,
                    "strategic_value": "<how it complements business>",
                    "risk_correlation": "<correlation with business risk>",
                    "expected_return": <percentage>
-               }}
+               }
            ],
-           "retirement_planning": {{
+           "retirement_planning": {
                "recommended_contribution": <annual dollar amount>,
                "vehicle": "<SEP-IRA/Solo 401k/Simple IRA>",
                "tax_benefit": <annual tax savings>,
                "catch_up_potential": <additional if age 50+>
-           }},
+           },
            "tax_optimization": [
-               {{
+               {
                    "strategy": "<tax strategy>",
                    "annual_savings": <dollar amount>,
                    "implementation": "<how to implement>",
                    "compliance_requirements": ["<requirement 1>", "<requirement 2>"]
-               }}
+               }
            ],
            "economic_hedging": [
-               {{
+               {
                    "economic_risk": "<inflation/recession/interest_rate>",
                    "hedge_strategy": "<specific hedging approach>",
                    "allocation": <dollar amount>,
                    "effectiveness": "<hedge effectiveness>"
-               }}
+               }
            ],
-           "monitoring_framework": {{
+           "monitoring_framework": {
                "review_frequency": "<monthly/quarterly/annual>",
                "rebalancing_triggers": ["<trigger 1>", "<trigger 2>"],
                "performance_benchmarks": ["<benchmark 1>", "<benchmark 2>"],
                "adjustment_criteria": ["<criteria 1>", "<criteria 2>"]
-           }},
+           },
            "implementation_timeline": [
-               {{
+               {
                    "phase": "<immediate/30_days/90_days>",
                    "actions": ["<action 1>", "<action 2>"],
                    "investment_amount": <dollar amount>,
                    "priority": "<high/medium/low>"
-               }}
+               }
            ]
-       }}
+       }
        
        Ensure all recommendations are appropriate for small business owners and current economic conditions.
        Consider the correlation between business risk and investment risk for proper diversification.
-       """
+       """)
 
-   @staticmethod
-   def _assess_risk_tolerance(analysis_result: Dict[str, Any], business_data: Dict[str, Any]) -> str:
-       """Assess risk tolerance based on business situation."""
-       
-       # Conservative factors
-       conservative_factors = 0
-       
-       # Cash runway
-       cash_runway = analysis_result.get('financial_health', {}).get('cash_runway_months', 6)
-       if cash_runway < 6:
-           conservative_factors += 2
-       elif cash_runway < 3:
-           conservative_factors += 3
-       
-       # Years in business
-       years = business_data.get('years_in_business', 0)
-       if years < 3:
-           conservative_factors += 1
-       elif years > 10:
-           conservative_factors -= 1
-       
-       # Financial health
-       health_score = analysis_result.get('financial_health', {}).get('health_score', 50)
-       if health_score < 50:
-           conservative_factors += 2
-       elif health_score > 80:
-           conservative_factors -= 1
-       
-       # Risk assessment
-       risk_score = analysis_result.get('risk_assessment', {}).get('overall_risk_score', 50)
-       if risk_score > 70:
-           conservative_factors += 2
-       elif risk_score < 30:
-           conservative_factors -= 1
-       
-       # Determine risk tolerance
-       if conservative_factors >= 5:
-           return "very_conservative"
-       elif conservative_factors >= 3:
-           return "conservative"
-       elif conservative_factors >= 1:
-           return "moderate"
-       elif conservative_factors <= -2:
-           return "aggressive"
-       else:
-           return "balanced"
-
-
-class ActionPlanPromptTemplates:
-   """Prompt templates for generating action plans."""
-   
-   @staticmethod
-   def get_action_plan_prompt(analysis_result: Dict[str, Any],
-                             business_data: Dict[str, Any],
-                             economic_data: Dict[str, Any]) -> str:
-       """Generate comprehensive action plan prompt."""
-       
-       return f"""
-       EXPERT BUSINESS ACTION PLANNER ROLE:
-       
-       Create a comprehensive, prioritized action plan for this US small business based on analysis results.
-       
-       BUSINESS SITUATION SUMMARY:
-       - Overall Score: {analysis_result.get('overall_score', {}).get('overall_score', 'N/A')}/100
-       - Critical Areas: {', '.join(analysis_result.get('overall_score', {}).get('improvement_areas', []))}
-       - Key Strengths: {', '.join(analysis_result.get('overall_score', {}).get('strengths', []))}
-       - Available Resources: ${business_data.get('current_cash', 0):,.0f} cash, {business_data.get('employees_count', 0)} employees
-       
-       ECONOMIC TIMING FACTORS:
-       - Economic Environment: {economic_data.get('small_business_impact', {}).get('overall_impact', 'N/A')}
-       - Fed Rate: {economic_data.get('fed_funds_rate', 'N/A')}% (affecting borrowing costs)
-       - Business Climate: {economic_data.get('business_climate_score', 'N/A')}/100
-       
-       CREATE COMPREHENSIVE ACTION PLAN IN JSON FORMAT:
-       {{
-           "action_plan_overview": {{
+_ACTION_PLAN_SCHEMA = sys.intern("""
+       {
+           "action_plan_overview": {
                "primary_objective": "<main goal for next 12 months>",
                "success_definition": "<how success will be measured>",
                "resource_allocation": "<how resources will be prioritized>",
                "timeline_overview": "<general timeline structure>"
-           }},
+           },
            "immediate_actions": [
-               {{
+               {
                    "action_id": "<unique identifier>",
                    "action": "<specific action to take>",
                    "category": "<financial/operational/marketing/strategic>",
@@ -1135,10 +894,10 @@ class ActionPlanPromptTemplates:
                        "<step 2>",
                        "<step 3>"
                    ]
-               }}
+               }
            ],
            "short_term_actions": [
-               {{
+               {
                    "action_id": "<unique identifier>",
                    "action": "<30-90 day action>",
                    "category": "<category>",
@@ -1149,85 +908,785 @@ class ActionPlanPromptTemplates:
                    "risk_level": "<low/medium/high>",
                    "success_probability": <percentage>,
                    "milestone_checkpoints": ["<checkpoint 1>", "<checkpoint 2>"]
-               }}
+               }
            ],
            "medium_term_initiatives": [
-               {{
+               {
                    "initiative": "<3-12 month initiative>",
                    "strategic_objective": "<alignment with business strategy>",
                    "total_investment": <dollar amount>,
                    "expected_return": <dollar amount or percentage>,
                    "timeline": "<months to complete>",
-                   "resource_requirements": {{
+                   "resource_requirements": {
                        "financial": <dollar amount>,
                        "human": "<staffing needs>",
                        "operational": "<operational changes needed>"
-                   }},
+                   },
                    "phases": [
-                       {{
+                       {
                            "phase": "<phase name>",
                            "duration": "<months>",
                            "key_deliverables": ["<deliverable 1>", "<deliverable 2>"],
                            "investment": <phase cost>
-                       }}
+                       }
                    ]
-               }}
+               }
            ],
-           "performance_tracking": {{
+           "performance_tracking": {
                "daily_metrics": ["<metric 1>", "<metric 2>"],
                "weekly_reviews": ["<review item 1>", "<review item 2>"],
                "monthly_assessments": ["<assessment 1>", "<assessment 2>"],
                "quarterly_evaluations": ["<evaluation 1>", "<evaluation 2>"],
                "annual_goals": ["<goal 1>", "<goal 2>"]
-           }},
+           },
            "risk_monitoring": [
-               {{
+               {
                    "risk": "<specific risk to monitor>",
                    "monitoring_frequency": "<daily/weekly/monthly>",
                    "early_warning_indicators": ["<indicator 1>", "<indicator 2>"],
                    "contingency_actions": ["<action 1>", "<action 2>"]
-               }}
+               }
            ],
-           "resource_allocation": {{
-               "budget_breakdown": {{
+           "resource_allocation": {
+               "budget_breakdown": {
                    "operations": <percentage>,
                    "growth_investments": <percentage>,
                    "emergency_reserves": <percentage>,
                    "marketing": <percentage>,
                    "technology": <percentage>
-               }},
-               "human_resource_plan": {{
+               },
+               "human_resource_plan": {
                    "current_capacity": "<assessment of current team>",
                    "hiring_needs": ["<role 1>", "<role 2>"],
                    "training_requirements": ["<training 1>", "<training 2>"],
                    "timeline": "<hiring/training timeline>"
-               }}
-           }},
+               }
+           },
            "success_milestones": [
-               {{
+               {
                    "milestone": "<specific milestone>",
                    "target_date": "<date>",
                    "success_criteria": "<measurable criteria>",
                    "celebration_plan": "<how to acknowledge achievement>"
-               }}
+               }
            ],
            "contingency_planning": [
-               {{
+               {
                    "scenario": "<potential challenge scenario>",
                    "probability": <percentage likelihood>,
                    "impact": "<high/medium/low>",
                    "response_plan": ["<response action 1>", "<response action 2>"],
                    "trigger_indicators": ["<trigger 1>", "<trigger 2>"]
-               }}
+               }
            ],
-           "review_and_adjustment": {{
+           "review_and_adjustment": {
                "review_schedule": "<how often to review plan>",
                "adjustment_criteria": ["<criteria for plan changes>"],
                "stakeholder_communication": "<how to communicate changes>",
                "learning_integration": "<how to incorporate lessons learned>"
-           }}
-       }}
+           }
+       }
        
        Ensure the action plan is realistic, properly sequenced, and accounts for business constraints and economic conditions.
        Make all actions specific, measurable, achievable, relevant, and time-bound (SMART).
-       """
\ No newline at end of file
+       """)
+
+
+class PromptContext(NamedTuple):
+    """Values shared by the recommendation and action plan prompts of one business.
+
+    Build one with ``PromptContext.from_raw`` and pass it as ``ctx`` to the four
+    builders, as ``build_all_prompts`` does, so the nested fields are extracted
+    once instead of once per prompt. Called without ``ctx``, each builder reads
+    only the fields it renders. Contexts are immutable tuples; derive a modified
+    copy with ``_replace``.
+    """
+
+    sector: Any
+    years_in_business: Any
+    employees_count: Any
+    current_cash_usd: str
+    monthly_expenses: float
+    overall_score: Any
+    improvement_areas: Any
+    strengths: Any
+    financial_status: Any
+    cash_runway: Any
+    performance_category: Any
+    risk_level: Any
+    growth_score: Any
+    readiness_level: Any
+    monthly_cash_flow: float
+    debt_capacity: float
+    health_score: Any
+    fed_funds_rate: Any
+    inflation_cpi: Any
+    business_climate_score: Any
+    financing_cost_impact: Any
+    economic_impact: Any
+    available_capital: Optional[float]
+    bond_yield: Optional[float]
+
+    @classmethod
+    def from_raw(cls, business_data: Dict[str, Any], analysis_result: Dict[str, Any],
+                 economic_data: Optional[Dict[str, Any]] = None) -> "PromptContext":
+        """Extract everything the recommendation builders read, once."""
+
+        current_cash = business_data.get('current_cash', 0)
+        monthly_expenses = business_data.get('monthly_expenses', 0)
+        economic = economic_data or {}
+
+        # Each nested section is looked up once and shared by its fields.
+        overall = _section(analysis_result, _K_OVERALL_SCORE)
+        financial = _section(analysis_result, _K_FINANCIAL_HEALTH)
+        impact = _section(economic, _K_SMALL_BUSINESS_IMPACT)
+
+        # Derived scalars, computed here once rather than in each builder.
+        # Only the investment prompt renders them; on bad input leave None and
+        # that builder re-reads the raw dicts, raising the error it always did.
+        # Investable capital keeps a three-month expense reserve aside.
+        try:
+            available_capital = max(0, current_cash - 3 * monthly_expenses)
+        except TypeError:
+            available_capital = None
+        try:
+            bond_yield = economic.get('fed_funds_rate', 5) + 1
+        except TypeError:
+            bond_yield = None
+
+        # Fields are named so none can land in a neighbour's slot; calling
+        # __new__ directly avoids the much slower keyword path of cls(...).
+        return cls.__new__(
+            cls,
+            sector=business_data.get('sector', _NA),
+            years_in_business=business_data.get('years_in_business', 0),
+            employees_count=business_data.get('employees_count', 0),
+            # Every builder renders the cash position, so format it once here.
+            current_cash_usd=f"{current_cash:,.0f}",
+            monthly_expenses=monthly_expenses,
+            overall_score=overall.get('overall_score', _NA),
+            improvement_areas=overall.get('improvement_areas', ()),
+            strengths=overall.get('strengths', ()),
+            financial_status=financial.get('status', _NA),
+            cash_runway=financial.get('cash_runway_months', _NA),
+            performance_category=_pluck(analysis_result, _MP_CATEGORY, _NA),
+            risk_level=_pluck(analysis_result, _RA_LEVEL, _NA),
+            growth_score=_pluck(analysis_result, _GA_SCORE, _NA),
+            readiness_level=_pluck(analysis_result, _GA_READINESS, _NA),
+            monthly_cash_flow=financial.get('monthly_cash_flow', 0),
+            debt_capacity=financial.get('debt_capacity', 0),
+            health_score=financial.get('health_score', _NA),
+            fed_funds_rate=economic.get('fed_funds_rate', _NA),
+            inflation_cpi=economic.get('inflation_cpi', _NA),
+            business_climate_score=economic.get('business_climate_score', _NA),
+            financing_cost_impact=impact.get('financing_cost_impact', _NA),
+            economic_impact=impact.get('overall_impact', _NA),
+            available_capital=available_capital,
+            bond_yield=bond_yield,
+        )
+
+
+class InsightContext:
+    """Request-scoped summaries shared by the insight prompts of one business.
+
+    Pass one context as ``ctx`` to the insight builders. Each summary is
+    formatted the first time a prompt reads it and reused by the rest;
+    summaries no prompt reads are never formatted.
+    """
+
+    def __init__(self, business_data: Dict[str, Any], analysis_result: Dict[str, Any],
+                 economic_data: Optional[Dict[str, Any]] = None,
+                 market_data: Optional[Dict[str, Any]] = None):
+        self.business_data = business_data
+        self.analysis_result = analysis_result
+        self.economic_data = economic_data
+        self.market_data = market_data
+
+    @cached_property
+    def current_revenue(self) -> float:
+        return _current_revenue(self.business_data)
+
+    @cached_property
+    def analysis_summary(self) -> str:
+        return _format_analysis_summary(self.analysis_result)
+
+    @cached_property
+    def financial_summary(self) -> str:
+        return _format_financial_summary(self.business_data, self.analysis_result)
+
+    @cached_property
+    def performance_summary(self) -> str:
+        return _format_performance_summary(self.analysis_result)
+
+    @cached_property
+    def strengths_block(self) -> str:
+        return _format_business_strengths(self.analysis_result)
+
+    @cached_property
+    def market_conditions(self) -> str:
+        return _format_market_conditions(self.market_data)
+
+    @cached_property
+    def econ_block(self) -> str:
+        return _add_economic_context_to_prompt(self.economic_data)
+
+
+class InsightPromptTemplates:
+    """Specialized prompt templates for generating business insights.
+
+    The builders are stateless; call them on the class, e.g.
+    ``InsightPromptTemplates.get_main_insight_prompt(...)``.
+    """
+    
+    @staticmethod
+    def get_main_insight_prompt(critical_area: str, analysis_result: Dict[str, Any],
+                               business_data: Dict[str, Any], economic_data: Dict[str, Any] = None,
+                               market_data: Dict[str, Any] = None,
+                               ctx: Optional[InsightContext] = None) -> str:
+        """Generate prompt for main business insight."""
+
+        current_revenue = ctx.current_revenue if ctx else _current_revenue(business_data)
+        analysis_summary = ctx.analysis_summary if ctx else _format_analysis_summary(analysis_result)
+        econ_block = ctx.econ_block if ctx else _add_economic_context_to_prompt(economic_data)
+
+        return f"""
+        EXPERT US SMALL BUSINESS ADVISOR ROLE:
+        
+        Generate the single most critical insight for this US small business based on comprehensive analysis.
+        
+        BUSINESS PROFILE:
+        - Business: {business_data.get('business_name', 'US Small Business')}
+        - Sector: {business_data.get('sector', _NA)}
+        - Location: {business_data.get('location', _NA)}
+        - Current Monthly Revenue: ${current_revenue:,.0f}
+        - Monthly Expenses: ${business_data.get('monthly_expenses', 0):,.0f}
+        - Cash Position: ${business_data.get('current_cash', 0):,.0f}
+        - Years Operating: {business_data.get('years_in_business', 0)}
+        
+        CRITICAL AREA IDENTIFIED: {critical_area}
+        
+        ANALYSIS SUMMARY:
+        {analysis_summary}
+        
+        {econ_block}
+        
+        GENERATE THE MOST IMPORTANT INSIGHT IN JSON FORMAT:""" + _MAIN_INSIGHT_SCHEMA
+   
+    @staticmethod
+    def get_problem_insight_prompt(problem: Dict[str, Any], analysis_result: Dict[str, Any],
+                                  business_data: Dict[str, Any], economic_data: Dict[str, Any] = None,
+                                  ctx: Optional[InsightContext] = None) -> str:
+        """Generate prompt for problem-specific insights."""
+
+        financial_summary = (ctx.financial_summary if ctx
+                             else _format_financial_summary(business_data, analysis_result))
+        econ_block = ctx.econ_block if ctx else _add_economic_context_to_prompt(economic_data)
+
+        return f"""
+        EXPERT BUSINESS PROBLEM SOLVER ROLE:
+
+        Analyze this specific business problem and provide detailed insights for resolution.
+
+        PROBLEM IDENTIFIED: {problem['type']}
+        Problem Urgency: {problem.get('urgency', 'medium')}
+        Problem Severity: {problem.get('severity', 'medium')}
+
+        BUSINESS CONTEXT:
+        - Sector: {business_data.get('sector', _NA)}
+        - Years Operating: {business_data.get('years_in_business', 0)}
+        - Current Financial State: {financial_summary}
+
+        PROBLEM DATA:
+        {_dumps(problem.get('data', {}))}
+
+        {econ_block}
+
+        PROVIDE PROBLEM ANALYSIS IN JSON FORMAT:""" + _PROBLEM_INSIGHT_SCHEMA
+    
+    @staticmethod
+    def get_opportunity_insight_prompt(opportunity: Dict[str, Any], analysis_result: Dict[str, Any],
+                                     business_data: Dict[str, Any], economic_data: Dict[str, Any] = None,
+                                     market_data: Dict[str, Any] = None,
+                                     ctx: Optional[InsightContext] = None) -> str:
+        """Generate prompt for opportunity-specific insights."""
+
+        strengths = ctx.strengths_block if ctx else _format_business_strengths(analysis_result)
+        market_conditions = (ctx.market_conditions if ctx
+                             else _format_market_conditions(market_data) if market_data
+                             else 'Limited market data available')
+        econ_block = ctx.econ_block if ctx else _add_economic_context_to_prompt(economic_data)
+
+        return f"""
+        EXPERT GROWTH STRATEGIST ROLE:
+
+        Analyze this growth opportunity and provide detailed insights for capitalization.
+
+        OPPORTUNITY IDENTIFIED: {opportunity['type']}
+        Opportunity Priority: {opportunity.get('priority', 'medium')}
+        Growth Potential: {opportunity.get('potential', 'medium')}
+
+        BUSINESS STRENGTHS TO LEVERAGE:
+        {strengths}
+
+        MARKET CONDITIONS:
+        {market_conditions}
+
+        OPPORTUNITY DATA:
+        {_dumps(opportunity.get('data', {}))}
+
+        {econ_block}
+
+        PROVIDE OPPORTUNITY ANALYSIS IN JSON FORMAT:""" + _OPPORTUNITY_INSIGHT_SCHEMA
+    
+    @staticmethod
+    def get_market_position_insight_prompt(business_data: Dict[str, Any],
+                                         market_data: Dict[str, Any],
+                                         economic_data: Dict[str, Any] = None,
+                                         ctx: Optional[InsightContext] = None) -> str:
+        """Generate prompt for market position insights."""
+
+        current_revenue = ctx.current_revenue if ctx else _current_revenue(business_data)
+        econ_block = ctx.econ_block if ctx else _add_economic_context_to_prompt(economic_data)
+
+        return f"""
+        EXPERT MARKET ANALYST ROLE:
+
+        Analyze this US small business market position and provide strategic positioning insights.
+
+        BUSINESS MARKET PROFILE:
+        - Sector: {business_data.get('sector', _NA)}
+        - Location: {business_data.get('location', _NA)}
+        - Current Revenue: ${current_revenue:,.0f}/month
+        - Business Model: {business_data.get('business_type', _NA)}
+        - Market Experience: {business_data.get('years_in_business', 0)} years
+
+        MARKET DATA:
+        {_dumps(market_data) if market_data else 'Limited market data available'}
+
+        {econ_block}
+
+        PROVIDE MARKET POSITION ANALYSIS IN JSON FORMAT:""" + _MARKET_POSITION_INSIGHT_SCHEMA
+    
+    @staticmethod
+    def get_economic_impact_insight_prompt(business_data: Dict[str, Any],
+                                         economic_data: Dict[str, Any],
+                                         ctx: Optional[InsightContext] = None) -> str:
+        """Generate prompt for economic impact insights."""
+
+        return f"""
+        EXPERT ECONOMIC ANALYST ROLE:
+
+        Analyze how current US economic conditions specifically impact this small business.
+
+        BUSINESS PROFILE:
+        - Sector: {business_data.get('sector', _NA)}
+        - Business Model: {business_data.get('business_type', _NA)}
+        - Customer Base: {business_data.get('primary_customers', _NA)}
+        - Location: {business_data.get('location', _NA)}
+
+        CURRENT US ECONOMIC CONDITIONS:
+        - Fed Funds Rate: {economic_data.get('fed_funds_rate', _NA)}%
+        - Inflation Rate: {economic_data.get('inflation_cpi', _NA)}
+        - Unemployment Rate: {economic_data.get('unemployment_rate', _NA)}%
+        - Consumer Confidence: {economic_data.get('consumer_confidence', _NA)}
+        - Small Business Optimism: {economic_data.get('small_business_optimism', _NA)}
+        - Economic Health Score: {economic_data.get('economic_health_score', _NA)}/100
+
+        PROVIDE ECONOMIC IMPACT ANALYSIS IN JSON FORMAT:""" + _ECONOMIC_IMPACT_INSIGHT_SCHEMA
+    
+    @staticmethod
+    def get_growth_strategy_insight_prompt(analysis_result: Dict[str, Any],
+                                         business_data: Dict[str, Any],
+                                         economic_data: Dict[str, Any] = None,
+                                         ctx: Optional[InsightContext] = None) -> str:
+        """Generate prompt for growth strategy insights."""
+
+        performance_summary = ctx.performance_summary if ctx else _format_performance_summary(analysis_result)
+        growth_score = _pluck(analysis_result, _GA_SCORE, _NA)
+        performance_category = _pluck(analysis_result, _MP_CATEGORY, _NA)
+        financial_status = _pluck(analysis_result, _FH_STATUS, _NA)
+        econ_block = ctx.econ_block if ctx else _add_economic_context_to_prompt(economic_data)
+
+        return f"""
+        EXPERT GROWTH STRATEGIST ROLE:
+
+        Develop comprehensive growth strategy insights for this US small business.
+
+        BUSINESS GROWTH PROFILE:
+        - Current Performance: {performance_summary}
+        - Growth Potential Score: {growth_score}/100
+        - Market Position: {performance_category}
+        - Financial Capacity: {financial_status}
+
+        BUSINESS CAPABILITIES:
+        - Years Experience: {business_data.get('years_in_business', 0)}
+        - Team Size: {business_data.get('employees_count', 0)}
+        - Sector Expertise: {business_data.get('sector', _NA)}
+
+        {econ_block}
+
+        PROVIDE GROWTH STRATEGY ANALYSIS IN JSON FORMAT:""" + _GROWTH_STRATEGY_INSIGHT_SCHEMA
+    
+    @staticmethod
+    def get_competitive_strategy_insight_prompt(analysis_result: Dict[str, Any],
+                                              business_data: Dict[str, Any],
+                                              ctx: Optional[InsightContext] = None) -> str:
+        """Generate prompt for competitive strategy insights."""
+
+        competitive_analysis = analysis_result.get(_K_COMPETITIVE_ANALYSIS, {})
+
+        performance_category = _pluck(analysis_result, _MP_CATEGORY, _NA)
+
+        return f"""
+        EXPERT COMPETITIVE STRATEGIST ROLE:
+
+        Develop competitive strategy insights for this US small business.
+
+        COMPETITIVE POSITION:
+        - Market Performance: {performance_category}
+        - Competitive Strengths: {competitive_analysis.get('competitive_strengths', [])}
+        - Competitive Weaknesses: {competitive_analysis.get('competitive_weaknesses', [])}
+        - Market Share: {competitive_analysis.get('estimated_market_share', _NA)}%
+
+        BUSINESS ASSETS:
+        - Experience: {business_data.get('years_in_business', 0)} years in market
+        - Sector: {business_data.get('sector', _NA)}
+        - Customer Base: {business_data.get('primary_customers', _NA)}
+
+        PROVIDE COMPETITIVE STRATEGY ANALYSIS IN JSON FORMAT:""" + _COMPETITIVE_STRATEGY_INSIGHT_SCHEMA
+
+
+class BusinessAnalysisPromptTemplates:
+   """Prompt templates for comprehensive business analysis."""
+   
+   @staticmethod
+   def get_comprehensive_analysis_prompt(business_data: Dict[str, Any], 
+                                       economic_data: Dict[str, Any],
+                                       market_data: Dict[str, Any]) -> str:
+       """Generate comprehensive business analysis prompt."""
+       
+       current_revenue = _current_revenue(business_data)
+       
+       parts = [
+           _COMPREHENSIVE_ANALYSIS_PREAMBLE,
+           f"       - Business Name: {business_data.get('business_name', 'US Small Business')}\n",
+           f"       - Industry Sector: {business_data.get('sector', _NA)}\n",
+           f"       - Location: {business_data.get('location', _NA)}\n",
+           f"       - Business Type: {business_data.get('business_type', _NA)}\n",
+           f"       - Years in Operation: {business_data.get('years_in_business', 0)}\n",
+           f"       - Employee Count: {business_data.get('employees_count', 0)}\n",
+           "       \n       FINANCIAL DATA (Last 6 Months):\n",
+           f"       - Monthly Revenue: {business_data.get('monthly_revenue', [])}\n",
+           f"       - Monthly Expenses: ${business_data.get('monthly_expenses', 0):,.0f}\n",
+           f"       - Current Cash Position: ${business_data.get('current_cash', 0):,.0f}\n",
+           f"       - Current Monthly Revenue: ${current_revenue:,.0f}\n",
+           "       \n       OPERATIONAL CONTEXT:\n",
+           f"       - Primary Customer Type: {business_data.get('primary_customers', _NA)}\n",
+           f"       - Main Business Challenges: {business_data.get('main_challenges', [])}\n",
+           f"       - Business Goals: {business_data.get('business_goals', [])}\n",
+           "       \n       CURRENT US ECONOMIC ENVIRONMENT:\n",
+           f"       - Fed Funds Rate: {economic_data.get('fed_funds_rate', _NA)}%\n",
+           f"       - Inflation Rate (CPI): {economic_data.get('inflation_cpi', _NA)}\n",
+           f"       - Unemployment Rate: {economic_data.get('unemployment_rate', _NA)}%\n",
+           f"       - Consumer Confidence Index: {economic_data.get('consumer_confidence', _NA)}\n",
+           f"       - Small Business Optimism Index: {economic_data.get('small_business_optimism', _NA)}\n",
+           f"       - GDP Growth Rate: {economic_data.get('gdp_growth', _NA)}%\n",
+           f"       - Economic Health Score: {economic_data.get('economic_health_score', _NA)}/100\n",
+           "       \n       MARKET CONDITIONS:\n       ",
+           _dumps(market_data) if market_data else 'Market data being analyzed',
+           "\n       \n       PROVIDE COMPREHENSIVE ANALYSIS IN JSON FORMAT:",
+           _COMPREHENSIVE_ANALYSIS_SCHEMA,
+       ]
+
+       return "".join(parts)
+
+
+def get_immediate_actions_prompt(analysis_result: Dict[str, Any],
+                                 business_data: Dict[str, Any],
+                                 economic_data: Dict[str, Any],
+                                 ctx: Optional[PromptContext] = None) -> str:
+    """Generate prompt for immediate action recommendations."""
+
+    if ctx is None:
+        overall_score = _pluck(analysis_result, _OS_SCORE, _NA)
+        financial_status = _pluck(analysis_result, _FH_STATUS, _NA)
+        cash_runway = _pluck(analysis_result, _FH_CASH_RUNWAY, _NA)
+        performance_category = _pluck(analysis_result, _MP_CATEGORY, _NA)
+        risk_level = _pluck(analysis_result, _RA_LEVEL, _NA)
+        current_cash_usd = f"{business_data.get('current_cash', 0):,.0f}"
+        monthly_expenses = business_data.get('monthly_expenses', 0)
+        employees_count = business_data.get('employees_count', 0)
+        financing_cost_impact = _pluck(economic_data, _SBI_FINANCING, _NA)
+        economic_impact = _pluck(economic_data, _SBI_OVERALL, _NA)
+    else:
+        overall_score = ctx.overall_score
+        financial_status = ctx.financial_status
+        cash_runway = ctx.cash_runway
+        performance_category = ctx.performance_category
+        risk_level = ctx.risk_level
+        current_cash_usd = ctx.current_cash_usd
+        monthly_expenses = ctx.monthly_expenses
+        employees_count = ctx.employees_count
+        financing_cost_impact = ctx.financing_cost_impact
+        economic_impact = ctx.economic_impact
+
+    return f"""
+       EXPERT BUSINESS ADVISOR ROLE:
+       
+       Based on comprehensive business analysis, generate immediate action recommendations for this US small business.
+       
+       CRITICAL SITUATION SUMMARY:
+       - Overall Business Score: {overall_score}/100
+       - Financial Health: {financial_status}
+       - Cash Runway: {cash_runway} months
+       - Market Performance: {performance_category}
+       - Risk Level: {risk_level}
+       
+       BUSINESS CONSTRAINTS:
+       - Available Cash: ${current_cash_usd}
+       - Monthly Expenses: ${monthly_expenses:,.0f}
+       - Team Size: {employees_count} employees
+       
+       ECONOMIC URGENCY FACTORS:
+       - Fed Rate Impact: {financing_cost_impact}
+       - Economic Environment: {economic_impact}
+       
+       GENERATE IMMEDIATE ACTION PLAN (NEXT 30 DAYS) IN JSON FORMAT:""" + _IMMEDIATE_ACTIONS_SCHEMA
+
+
+def get_strategic_actions_prompt(analysis_result: Dict[str, Any],
+                                 business_data: Dict[str, Any],
+                                 economic_data: Dict[str, Any],
+                                 ctx: Optional[PromptContext] = None) -> str:
+    """Generate prompt for strategic action recommendations."""
+
+    if ctx is None:
+        years_in_business = business_data.get('years_in_business', 0)
+        growth_score = _pluck(analysis_result, _GA_SCORE, _NA)
+        performance_category = _pluck(analysis_result, _MP_CATEGORY, _NA)
+        readiness_level = _pluck(analysis_result, _GA_READINESS, _NA)
+        current_cash_usd = f"{business_data.get('current_cash', 0):,.0f}"
+        monthly_cash_flow = _pluck(analysis_result, _FH_CASH_FLOW, 0)
+        debt_capacity = _pluck(analysis_result, _FH_DEBT_CAPACITY, 0)
+        economic_impact = _pluck(economic_data, _SBI_OVERALL, _NA)
+        fed_funds_rate = economic_data.get('fed_funds_rate', _NA)
+        business_climate_score = economic_data.get('business_climate_score', _NA)
+    else:
+        years_in_business = ctx.years_in_business
+        growth_score = ctx.growth_score
+        performance_category = ctx.performance_category
+        readiness_level = ctx.readiness_level
+        current_cash_usd = ctx.current_cash_usd
+        monthly_cash_flow = ctx.monthly_cash_flow
+        debt_capacity = ctx.debt_capacity
+        economic_impact = ctx.economic_impact
+        fed_funds_rate = ctx.fed_funds_rate
+        business_climate_score = ctx.business_climate_score
+
+    return f"""
+       EXPERT STRATEGIC BUSINESS CONSULTANT ROLE:
+       
+       Develop strategic action recommendations (3-12 month horizon) for this US small business.
+       
+       STRATEGIC CONTEXT:
+       - Business Maturity: {years_in_business} years in operation
+       - Growth Potential: {growth_score}/100
+       - Market Position: {performance_category}
+       - Expansion Readiness: {readiness_level}
+       
+       INVESTMENT CAPACITY:
+       - Available Capital: ${current_cash_usd}
+       - Monthly Cash Generation: ${monthly_cash_flow:,.0f}
+       - Debt Capacity: ${debt_capacity:,.0f}
+       
+       ECONOMIC STRATEGIC FACTORS:
+       - Economic Environment: {economic_impact}
+       - Interest Rate Environment: {fed_funds_rate}%
+       - Business Climate Score: {business_climate_score}/100
+       
+       GENERATE STRATEGIC ACTION PLAN IN JSON FORMAT:""" + _STRATEGIC_ACTIONS_SCHEMA
+
+
+def get_investment_recommendations_prompt(analysis_result: Dict[str, Any],
+                                          business_data: Dict[str, Any],
+                                          economic_data: Dict[str, Any],
+                                          ctx: Optional[PromptContext] = None) -> str:
+    """Generate prompt for investment recommendations."""
+
+    if ctx is None or ctx.available_capital is None or ctx.bond_yield is None:
+        current_cash = business_data.get('current_cash', 0)
+        current_cash_usd = f"{current_cash:,.0f}"
+        # Investable capital keeps a three-month expense reserve aside.
+        available_capital = max(0, current_cash - business_data.get('monthly_expenses', 0) * 3)
+        years_in_business = business_data.get('years_in_business', 0)
+        sector = business_data.get('sector', _NA)
+        monthly_cash_flow = _pluck(analysis_result, _FH_CASH_FLOW, 0)
+        debt_capacity = _pluck(analysis_result, _FH_DEBT_CAPACITY, 0)
+        health_score = _pluck(analysis_result, _FH_HEALTH_SCORE, _NA)
+        fed_funds_rate = economic_data.get('fed_funds_rate', _NA)
+        inflation_cpi = economic_data.get('inflation_cpi', _NA)
+        economic_impact = _pluck(economic_data, _SBI_OVERALL, _NA)
+        bond_yield = economic_data.get('fed_funds_rate', 5) + 1
+    else:
+        current_cash_usd = ctx.current_cash_usd
+        available_capital = ctx.available_capital
+        years_in_business = ctx.years_in_business
+        sector = ctx.sector
+        monthly_cash_flow = ctx.monthly_cash_flow
+        debt_capacity = ctx.debt_capacity
+        health_score = ctx.health_score
+        fed_funds_rate = ctx.fed_funds_rate
+        inflation_cpi = ctx.inflation_cpi
+        economic_impact = ctx.economic_impact
+        bond_yield = ctx.bond_yield
+
+    # Two fragments (header + schema): one concatenation sizes the result
+    # exactly, which beats an io.StringIO accumulator at this fragment count.
+    return f"""
+       EXPERT SMALL BUSINESS INVESTMENT ADVISOR ROLE:
+       
+       Provide comprehensive investment recommendations for this US small business owner.
+       
+       INVESTOR PROFILE:
+       - Business Owner with {years_in_business} years experience
+       - Sector Expertise: {sector}
+       - Available Investment Capital: ${available_capital:,.0f}
+       - Monthly Business Cash Flow: ${monthly_cash_flow:,.0f}
+       - Risk Tolerance: {_assess_risk_tolerance(analysis_result, business_data)}
+       
+       BUSINESS INVESTMENT CAPACITY:
+       - Cash Position: ${current_cash_usd}
+       - Debt Capacity: ${debt_capacity:,.0f}
+       - Business Health Score: {health_score}/100
+       
+       CURRENT ECONOMIC ENVIRONMENT:
+       - Fed Funds Rate: {fed_funds_rate}%
+       - Inflation Rate: {inflation_cpi}
+       - Market Conditions: {economic_impact}
+       - Bond Yields: Estimated {bond_yield:.1f}% for 10-year Treasury
+       
+       PROVIDE INVESTMENT RECOMMENDATIONS IN JSON FORMAT:""" + _INVESTMENT_RECOMMENDATIONS_SCHEMA
+
+
+def _assess_risk_tolerance(analysis_result: Dict[str, Any], business_data: Dict[str, Any]) -> str:
+    """Assess risk tolerance based on business situation."""
+
+    # Cash runway
+    cash_runway = _pluck(analysis_result, _FH_CASH_RUNWAY, 6)
+    runway_factor = 2 if cash_runway < 6 else 0
+
+    # Years in business
+    years = business_data.get('years_in_business', 0)
+    years_factor = 1 if years < 3 else -1 if years > 10 else 0
+
+    # Financial health
+    health_score = _pluck(analysis_result, _FH_HEALTH_SCORE, 50)
+    health_factor = 2 if health_score < 50 else -1 if health_score > 80 else 0
+
+    # Risk assessment
+    risk_score = _pluck(analysis_result, _RA_SCORE, 50)
+    risk_factor = 2 if risk_score > 70 else -1 if risk_score < 30 else 0
+
+    # Determine risk tolerance
+    conservative_factors = runway_factor + years_factor + health_factor + risk_factor
+    if conservative_factors >= 5:
+        return _VERY_CONSERVATIVE
+    elif conservative_factors >= 3:
+        return _CONSERVATIVE
+    elif conservative_factors >= 1:
+        return _MODERATE
+    elif conservative_factors <= -2:
+        return _AGGRESSIVE
+    else:
+        return _BALANCED
+
+
+class RecommendationPromptTemplates:
+   """Prompt templates for generating business recommendations."""
+   
+   get_immediate_actions_prompt = staticmethod(get_immediate_actions_prompt)
+   get_strategic_actions_prompt = staticmethod(get_strategic_actions_prompt)
+   get_investment_recommendations_prompt = staticmethod(get_investment_recommendations_prompt)
+   _assess_risk_tolerance = staticmethod(_assess_risk_tolerance)
+
+
+class ActionPlanPromptTemplates:
+   """Prompt templates for generating action plans."""
+   
+   @staticmethod
+   def get_action_plan_prompt(analysis_result: Dict[str, Any],
+                             business_data: Dict[str, Any],
+                             economic_data: Dict[str, Any],
+                             ctx: Optional[PromptContext] = None) -> str:
+       """Generate comprehensive action plan prompt."""
+       
+       if ctx is None:
+           overall_score = _pluck(analysis_result, _OS_SCORE, _NA)
+           improvement_areas = _pluck(analysis_result, _OS_IMPROVEMENT_AREAS, ())
+           strengths = _pluck(analysis_result, _OS_STRENGTHS, ())
+           current_cash_usd = f"{business_data.get('current_cash', 0):,.0f}"
+           employees_count = business_data.get('employees_count', 0)
+           economic_impact = _pluck(economic_data, _SBI_OVERALL, _NA)
+           fed_funds_rate = economic_data.get('fed_funds_rate', _NA)
+           business_climate_score = economic_data.get('business_climate_score', _NA)
+       else:
+           overall_score = ctx.overall_score
+           improvement_areas = ctx.improvement_areas
+           strengths = ctx.strengths
+           current_cash_usd = ctx.current_cash_usd
+           employees_count = ctx.employees_count
+           economic_impact = ctx.economic_impact
+           fed_funds_rate = ctx.fed_funds_rate
+           business_climate_score = ctx.business_climate_score
+
+       return f"""
+       EXPERT BUSINESS ACTION PLANNER ROLE:
+       
+       Create a comprehensive, prioritized action plan for this US small business based on analysis results.
+       
+       BUSINESS SITUATION SUMMARY:
+       - Overall Score: {overall_score}/100
+       - Critical Areas: {', '.join(improvement_areas)}
+       - Key Strengths: {', '.join(strengths)}
+       - Available Resources: ${current_cash_usd} cash, {employees_count} employees
+       
+       ECONOMIC TIMING FACTORS:
+       - Economic Environment: {economic_impact}
+       - Fed Rate: {fed_funds_rate}% (affecting borrowing costs)
+       - Business Climate: {business_climate_score}/100
+       
+       CREATE COMPREHENSIVE ACTION PLAN IN JSON FORMAT:""" + _ACTION_PLAN_SCHEMA
+
+
+# Builders run by build_all_prompts, keyed by the name of the prompt they return.
+_PROMPT_BUILDERS = (
+    ("immediate", get_immediate_actions_prompt),
+    ("strategic", get_strategic_actions_prompt),
+    ("investment", get_investment_recommendations_prompt),
+    ("action_plan", ActionPlanPromptTemplates.get_action_plan_prompt),
+)
+
+
+def build_all_prompts(analysis_result: Dict[str, Any], business_data: Dict[str, Any],
+                      economic_data: Dict[str, Any]) -> Dict[str, str]:
+    """Build the recommendation and action plan prompts for one business.
+
+    The PromptContext is extracted once and shared by all four builders;
+    ``scripts/benchmark_prompts.py`` checks that this beats four separate builds.
+
+    Each prompt is built on its own: a builder that raises is logged and its
+    key left out, so one bad field never costs the other prompts. A
+    non-numeric ``monthly_expenses`` drops ``immediate`` and ``investment``,
+    a non-numeric ``fed_funds_rate`` drops ``investment``, and non-string
+    improvement areas or strengths drop ``action_plan``. A non-numeric
+    ``current_cash`` breaks every prompt, so ``from_raw`` raises it instead.
+    """
+
+    ctx = PromptContext.from_raw(business_data, analysis_result, economic_data)
+    prompts = {}
+    for name, builder in _PROMPT_BUILDERS:
+        try:
+            prompts[name] = builder(analysis_result, business_data, economic_data, ctx=ctx)
+        except Exception as e:
+            logger.error(f"Error building {name} prompt: {str(e)}")
+    return prompts
@@ -1,15 +1,92 @@
 """Input validation utilities for business data."""
 
 import re
-from typing import Any, List, Dict, Optional, Union
+import string
+from functools import lru_cache
+from typing import Any, Callable, List, Dict, Optional, Union
 from datetime import datetime
 
 
+# Patterns used on every validation call, compiled once at import.
+_WHITESPACE_RE = re.compile(r'\s+')
+_HTML_TAG_RE = re.compile(r'<[^>]*>')
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_PHONE_STRIP_RE = re.compile(r'[^\d+]')
+_ISO_DATE_RE = re.compile(r'[0-9]{4}-[0-9]{2}-[0-9]{2}')
+
+# Pakistani phone number formats: +92xxxxxxxxxx, 03xxxxxxxxx, 92xxxxxxxxxx
+_PHONE_RE = re.compile(r'^(?:\+92[0-9]{10}|03[0-9]{9}|92[0-9]{10})$')
+
+
+# Allowed values for the enumerated fields, built once at import.
+_VALID_SECTORS = frozenset({
+    'electronics', 'textile', 'auto', 'food', 'retail'
+})
+
+_VALID_LOCATIONS = frozenset({
+    'clifton', 'dha', 'saddar', 'tariq_road', 'gulshan',
+    'gulistan_e_johar', 'korangi', 'landhi', 'north_karachi', 'nazimabad'
+})
+
+_VALID_BUSINESS_TYPES = frozenset({
+    'retail_shop', 'manufacturing', 'service_provider', 'trading_wholesale'
+})
+
+_VALID_CUSTOMERS = frozenset({
+    'local_walk_ins', 'regular_customers', 'online_delivery',
+    'wholesale_buyers', 'corporate_clients'
+})
+
+_VALID_CHALLENGES = frozenset({
+    'declining_sales', 'high_competition', 'cash_flow_issues',
+    'supplier_problems', 'marketing_customer_acquisition',
+    'inventory_management', 'staff_operational_issues'
+})
+
+_VALID_GOALS = frozenset({
+    'increase_profits', 'expand_open_new_location', 'improve_cash_flow',
+    'invest_surplus_money', 'get_bank_loan'
+})
+
+# Accepted date formats in priority order; day-first wins for ambiguous dates.
+_DATE_FORMATS = ('%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y')
+
+# Lowercase ASCII and turn separators into underscores in one translate pass.
+# Locations and customer types treat '-' as a separator; business types,
+# challenges and goals use '/' instead.
+_ASCII_LOWER = {ord(c): c.lower() for c in string.ascii_uppercase}
+_DASH_NORMALIZE_TABLE = str.maketrans({**_ASCII_LOWER, ' ': '_', '-': '_'})
+_SLASH_NORMALIZE_TABLE = str.maketrans({**_ASCII_LOWER, ' ': '_', '/': '_'})
+
+_SECTOR_ERR = f"Invalid sector. Must be one of: {', '.join(sorted(_VALID_SECTORS))}"
+_LOCATION_ERR = f"Invalid location. Must be one of: {', '.join(sorted(_VALID_LOCATIONS))}"
+_BUSINESS_TYPE_ERR = f"Invalid business type. Must be one of: {', '.join(sorted(_VALID_BUSINESS_TYPES))}"
+_CUSTOMERS_ERR = f"Invalid customer type. Must be one of: {', '.join(sorted(_VALID_CUSTOMERS))}"
+
+
 class ValidationError(Exception):
     """Custom exception for validation errors."""
     pass
 
 
+def _has_excess_whitespace(text: str) -> bool:
+    """Return True if collapsing whitespace runs would change the text.
+
+    Every whitespace character other than a plain space is non-printable,
+    so single-spaced printable text can skip the regex substitution.
+    """
+    return '  ' in text or not text.isprintable()
+
+
+def _normalize_choice(value: str, table: Dict[int, str]) -> str:
+    """Strip, lowercase and underscore-join a free-text choice."""
+    normalized = value.strip().translate(table)
+    if not normalized.isascii():
+        # The table only folds ASCII; leave the rest to str.lower()
+        normalized = normalized.lower()
+    return normalized
+
+
 def validate_business_name(name: str) -> str:
     """Validate and clean business name."""
     if not name or not isinstance(name, str):
@@ -24,80 +101,85 @@ def validate_business_name(name: str) -> str:
         raise ValidationError("Business name must be less than 255 characters")
     
     # Remove excessive whitespace
-    cleaned_name = re.sub(r'\s+', ' ', cleaned_name)
+    if _has_excess_whitespace(cleaned_name):
+        cleaned_name = _WHITESPACE_RE.sub(' ', cleaned_name)
     
     return cleaned_name
 
 
+# The enumerated validators see the same handful of spellings on almost every
+# request, so the normalize-and-lookup step is memoized per raw string. Callers
+# reject non-string input first; invalid values raise inside and are never cached.
+@lru_cache(maxsize=64)
+def _clean_sector(sector: str) -> str:
+    sector_clean = sector.lower().strip()
+    
+    if sector_clean not in _VALID_SECTORS:
+        raise ValidationError(_SECTOR_ERR)
+    
+    return sector_clean
+
+
+@lru_cache(maxsize=64)
+def _clean_location(location: str) -> str:
+    location_clean = _normalize_choice(location, _DASH_NORMALIZE_TABLE)
+    
+    if location_clean not in _VALID_LOCATIONS:
+        raise ValidationError(_LOCATION_ERR)
+    
+    return location_clean
+
+
+@lru_cache(maxsize=64)
+def _clean_business_type(business_type: str) -> str:
+    type_clean = _normalize_choice(business_type, _SLASH_NORMALIZE_TABLE)
+    
+    if type_clean not in _VALID_BUSINESS_TYPES:
+        raise ValidationError(_BUSINESS_TYPE_ERR)
+    
+    return type_clean
+
+
+@lru_cache(maxsize=64)
+def _clean_customers(customers: str) -> str:
+    customers_clean = _normalize_choice(customers, _DASH_NORMALIZE_TABLE)
+    
+    if customers_clean not in _VALID_CUSTOMERS:
+        raise ValidationError(_CUSTOMERS_ERR)
+    
+    return customers_clean
+
+
 def validate_sector(sector: str) -> str:
     """Validate business sector."""
-    valid_sectors = {
-        'electronics', 'textile', 'auto', 'food', 'retail'
-    }
-    
     if not sector or not isinstance(sector, str):
         raise ValidationError("Sector is required")
     
-    sector_clean = sector.lower().strip()
-    
-    if sector_clean not in valid_sectors:
-        raise ValidationError(f"Invalid sector. Must be one of: {', '.join(valid_sectors)}")
-    
-    return sector_clean
+    return _clean_sector(sector)
 
 
 def validate_karachi_location(location: str) -> str:
     """Validate Karachi location."""
-    valid_locations = {
-        'clifton', 'dha', 'saddar', 'tariq_road', 'gulshan', 
-        'gulistan_e_johar', 'korangi', 'landhi', 'north_karachi', 'nazimabad'
-    }
-    
     if not location or not isinstance(location, str):
         raise ValidationError("Location is required")
     
-    # Clean location string
-    location_clean = location.lower().strip().replace(' ', '_').replace('-', '_')
-    
-    if location_clean not in valid_locations:
-        raise ValidationError(f"Invalid location. Must be one of: {', '.join(valid_locations)}")
-    
-    return location_clean
+    return _clean_location(location)
 
 
 def validate_business_type(business_type: str) -> str:
     """Validate business type."""
-    valid_types = {
-        'retail_shop', 'manufacturing', 'service_provider', 'trading_wholesale'
-    }
-    
     if not business_type or not isinstance(business_type, str):
         raise ValidationError("Business type is required")
     
-    type_clean = business_type.lower().strip().replace(' ', '_').replace('/', '_')
-    
-    if type_clean not in valid_types:
-        raise ValidationError(f"Invalid business type. Must be one of: {', '.join(valid_types)}")
-    
-    return type_clean
+    return _clean_business_type(business_type)
 
 
 def validate_primary_customers(customers: str) -> str:
     """Validate primary customer type."""
-    valid_customers = {
-        'local_walk_ins', 'regular_customers', 'online_delivery', 
-        'wholesale_buyers', 'corporate_clients'
-    }
-    
     if not customers or not isinstance(customers, str):
         raise ValidationError("Primary customers type is required")
     
-    customers_clean = customers.lower().strip().replace(' ', '_').replace('-', '_')
-    
-    if customers_clean not in valid_customers:
-        raise ValidationError(f"Invalid customer type. Must be one of: {', '.join(valid_customers)}")
-    
-    return customers_clean
+    return _clean_customers(customers)
 
 
 def validate_monthly_revenue(revenue: List[float]) -> List[float]:
@@ -108,6 +190,17 @@ def validate_monthly_revenue(revenue: List[float]) -> List[float]:
     if len(revenue) != 6:
         raise ValidationError("Monthly revenue must contain exactly 6 values")
     
+    # Fast path: convert and bounds-check all months at once. Any failure
+    # (including NaN) falls through to the per-month loop, which raises the
+    # precise error for the first offending month.
+    try:
+        validated_revenue = list(map(float, revenue))
+    except (ValueError, TypeError):
+        pass
+    else:
+        if all(0 <= value <= 100000000 for value in validated_revenue):
+            return validated_revenue
+    
     validated_revenue = []
     
     for i, value in enumerate(revenue):
@@ -124,78 +217,68 @@ def validate_monthly_revenue(revenue: List[float]) -> List[float]:
     return validated_revenue
 
 
-def validate_monthly_expenses(expenses: float) -> float:
-    """Validate monthly expenses."""
-    try:
-        expenses_float = float(expenses)
-    except (ValueError, TypeError):
-        raise ValidationError("Monthly expenses must be a valid number")
-    
-    if expenses_float < 0:
-        raise ValidationError("Monthly expenses cannot be negative")
-    
-    if expenses_float > 50000000:  # 5 crore limit
-        raise ValidationError("Monthly expenses seem unreasonably high")
+def _make_numeric_validator(
+    name: str,
+    label: str,
+    caster: type,
+    upper: Union[int, float],
+    too_high_msg: str,
+    doc: str,
+) -> Callable[[Any], Union[int, float]]:
+    """Build a non-negative bounded number validator with fixed messages."""
+    invalid_msg = f"{label} must be a valid number"
+    negative_msg = f"{label} cannot be negative"
+    
+    def validator(value: Any) -> Union[int, float]:
+        # Values that already have the target type skip the constructor call
+        if type(value) is caster:
+            number = value
+        else:
+            try:
+                number = caster(value)
+            except (ValueError, TypeError):
+                raise ValidationError(invalid_msg)
+        
+        if number < 0:
+            raise ValidationError(negative_msg)
+        
+        if number > upper:
+            raise ValidationError(too_high_msg)
+        
+        return number
     
-    return expenses_float
+    validator.__name__ = validator.__qualname__ = name
+    validator.__doc__ = doc
+    return validator
 
 
-def validate_current_cash(cash: float) -> float:
-    """Validate current cash amount."""
-    try:
-        cash_float = float(cash)
-    except (ValueError, TypeError):
-        raise ValidationError("Current cash must be a valid number")
-    
-    if cash_float < 0:
-        raise ValidationError("Current cash cannot be negative")
-    
-    if cash_float > 1000000000:  # 100 crore limit
-        raise ValidationError("Current cash amount seems unreasonably high")
-    
-    return cash_float
+validate_monthly_expenses = _make_numeric_validator(
+    'validate_monthly_expenses', "Monthly expenses", float, 50000000,  # 5 crore limit
+    "Monthly expenses seem unreasonably high",
+    "Validate monthly expenses.",
+)
 
+validate_current_cash = _make_numeric_validator(
+    'validate_current_cash', "Current cash", float, 1000000000,  # 100 crore limit
+    "Current cash amount seems unreasonably high",
+    "Validate current cash amount.",
+)
 
-def validate_employees_count(count: int) -> int:
-    """Validate employee count."""
-    try:
-        count_int = int(count)
-    except (ValueError, TypeError):
-        raise ValidationError("Employee count must be a valid number")
-    
-    if count_int < 0:
-        raise ValidationError("Employee count cannot be negative")
-    
-    if count_int > 10000:
-        raise ValidationError("Employee count seems unreasonably high for SME")
-    
-    return count_int
+validate_employees_count = _make_numeric_validator(
+    'validate_employees_count', "Employee count", int, 10000,
+    "Employee count seems unreasonably high for SME",
+    "Validate employee count.",
+)
 
-
-def validate_years_in_business(years: int) -> int:
-    """Validate years in business."""
-    try:
-        years_int = int(years)
-    except (ValueError, TypeError):
-        raise ValidationError("Years in business must be a valid number")
-    
-    if years_int < 0:
-        raise ValidationError("Years in business cannot be negative")
-    
-    if years_int > 100:
-        raise ValidationError("Years in business seems unreasonably high")
-    
-    return years_int
+validate_years_in_business = _make_numeric_validator(
+    'validate_years_in_business', "Years in business", int, 100,
+    "Years in business seems unreasonably high",
+    "Validate years in business.",
+)
 
 
 def validate_challenges_list(challenges: List[str]) -> List[str]:
     """Validate business challenges list."""
-    valid_challenges = {
-        'declining_sales', 'high_competition', 'cash_flow_issues', 
-        'supplier_problems', 'marketing_customer_acquisition',
-        'inventory_management', 'staff_operational_issues'
-    }
-    
     if not challenges:
         return []
     
@@ -208,9 +291,14 @@ def validate_challenges_list(challenges: List[str]) -> List[str]:
         if not isinstance(challenge, str):
             continue
         
-        challenge_clean = challenge.lower().strip().replace(' ', '_').replace('/', '_')
+        # Already-canonical values skip normalization
+        if challenge in _VALID_CHALLENGES:
+            validated_challenges.append(challenge)
+            continue
+        
+        challenge_clean = _normalize_choice(challenge, _SLASH_NORMALIZE_TABLE)
         
-        if challenge_clean in valid_challenges:
+        if challenge_clean in _VALID_CHALLENGES:
             validated_challenges.append(challenge_clean)
     
     return validated_challenges
@@ -218,11 +306,6 @@ def validate_challenges_list(challenges: List[str]) -> List[str]:
 
 def validate_goals_list(goals: List[str]) -> List[str]:
     """Validate business goals list."""
-    valid_goals = {
-        'increase_profits', 'expand_open_new_location', 'improve_cash_flow',
-        'invest_surplus_money', 'get_bank_loan'
-    }
-    
     if not goals:
         return []
     
@@ -235,9 +318,14 @@ def validate_goals_list(goals: List[str]) -> List[str]:
         if not isinstance(goal, str):
             continue
         
-        goal_clean = goal.lower().strip().replace(' ', '_').replace('/', '_')
+        # Already-canonical values skip normalization
+        if goal in _VALID_GOALS:
+            validated_goals.append(goal)
+            continue
+        
+        goal_clean = _normalize_choice(goal, _SLASH_NORMALIZE_TABLE)
         
-        if goal_clean in valid_goals:
+        if goal_clean in _VALID_GOALS:
             validated_goals.append(goal_clean)
     
     return validated_goals
@@ -257,7 +345,8 @@ def validate_notes(notes: str) -> str:
         raise ValidationError("Notes must be less than 1000 characters")
     
     # Remove excessive whitespace
-    cleaned_notes = re.sub(r'\s+', ' ', cleaned_notes)
+    if _has_excess_whitespace(cleaned_notes):
+        cleaned_notes = _WHITESPACE_RE.sub(' ', cleaned_notes)
     
     return cleaned_notes
 
@@ -267,9 +356,7 @@ def validate_email(email: str) -> str:
     if not email:
         raise ValidationError("Email is required")
     
-    email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    
-    if not re.match(email_pattern, email):
+    if not _EMAIL_RE.match(email):
         raise ValidationError("Invalid email format")
     
     return email.lower().strip()
@@ -281,18 +368,9 @@ def validate_phone_number(phone: str) -> str:
         raise ValidationError("Phone number is required")
     
     # Clean phone number
-    phone_clean = re.sub(r'[^\d+]', '', phone)
-    
-    # Pakistani phone number patterns
-    patterns = [
-        r'^\+92[0-9]{10}$',  # +92xxxxxxxxxx
-        r'^03[0-9]{9}$',     # 03xxxxxxxxx
-        r'^92[0-9]{10}$',    # 92xxxxxxxxxx
-    ]
-    
-    valid = any(re.match(pattern, phone_clean) for pattern in patterns)
+    phone_clean = _PHONE_STRIP_RE.sub('', phone)
     
-    if not valid:
+    if not _PHONE_RE.match(phone_clean):
         raise ValidationError("Invalid Pakistani phone number format")
     
     return phone_clean
@@ -333,10 +411,13 @@ def sanitize_string_input(text: str, max_length: int = None) -> str:
         return ""
     
     # Remove potential HTML/script tags
-    text = re.sub(r'<[^>]*>', '', text)
+    if '<' in text:
+        text = _HTML_TAG_RE.sub('', text)
     
     # Remove excessive whitespace
-    text = re.sub(r'\s+', ' ', text.strip())
+    text = text.strip()
+    if _has_excess_whitespace(text):
+        text = _WHITESPACE_RE.sub(' ', text)
     
     if max_length and len(text) > max_length:
         text = text[:max_length]
@@ -349,9 +430,17 @@ def validate_date_string(date_str: str) -> datetime:
     if not date_str:
         raise ValidationError("Date is required")
     
+    # Canonical YYYY-MM-DD goes through the C ISO parser. Anything looser
+    # (single-digit parts, slashes) keeps the strptime fallbacks below.
+    if isinstance(date_str, str) and _ISO_DATE_RE.fullmatch(date_str):
+        try:
+            return datetime.fromisoformat(date_str)
+        except ValueError:
+            raise ValidationError("Invalid date format. Use YYYY-MM-DD or DD/MM/YYYY")
+    
     try:
         # Try common date formats
-        for date_format in ['%Y-%m-%d', '%d/%m/%Y', '%m/%d/%Y']:
+        for date_format in _DATE_FORMATS:
             try:
                 return datetime.strptime(date_str, date_format)
             except ValueError:
@@ -363,37 +452,42 @@ def validate_date_string(date_str: str) -> datetime:
         raise ValidationError("Invalid date format. Use YYYY-MM-DD or DD/MM/YYYY")
 
 
+# Required business fields and their validators, in output order
+_REQUIRED_FIELD_VALIDATORS = (
+    ('business_name', validate_business_name),
+    ('sector', validate_sector),
+    ('location_area', validate_karachi_location),
+    ('business_type', validate_business_type),
+    ('monthly_revenue', validate_monthly_revenue),
+    ('monthly_expenses', validate_monthly_expenses),
+    ('current_cash', validate_current_cash),
+    ('employees_count', validate_employees_count),
+    ('years_in_business', validate_years_in_business),
+    ('primary_customers', validate_primary_customers),
+)
+_REQUIRED_BUSINESS_FIELDS = frozenset(field for field, _ in _REQUIRED_FIELD_VALIDATORS)
+
+
 def validate_business_data(data: Dict[str, Any]) -> Dict[str, Any]:
     """Validate complete business data dictionary."""
     validated_data = {}
     
     # Required fields validation
-    required_fields = [
-        'business_name', 'sector', 'location_area', 'business_type',
-        'monthly_revenue', 'monthly_expenses', 'current_cash',
-        'employees_count', 'years_in_business', 'primary_customers'
-    ]
-    
-    for field in required_fields:
-        if field not in data:
-            raise ValidationError(f"Required field '{field}' is missing")
+    missing_fields = _REQUIRED_BUSINESS_FIELDS.difference(data)
+    if missing_fields:
+        raise ValidationError(f"Required fields missing: {', '.join(sorted(missing_fields))}")
     
     # Validate each field
-    validated_data['business_name'] = validate_business_name(data['business_name'])
-    validated_data['sector'] = validate_sector(data['sector'])
-    validated_data['location_area'] = validate_karachi_location(data['location_area'])
-    validated_data['business_type'] = validate_business_type(data['business_type'])
-    validated_data['monthly_revenue'] = validate_monthly_revenue(data['monthly_revenue'])
-    validated_data['monthly_expenses'] = validate_monthly_expenses(data['monthly_expenses'])
-    validated_data['current_cash'] = validate_current_cash(data['current_cash'])
-    validated_data['employees_count'] = validate_employees_count(data['employees_count'])
-    validated_data['years_in_business'] = validate_years_in_business(data['years_in_business'])
-    validated_data['primary_customers'] = validate_primary_customers(data['primary_customers'])
-    
-    # Optional fields
-    validated_data['main_challenges'] = validate_challenges_list(data.get('main_challenges', []))
-    validated_data['business_goals'] = validate_goals_list(data.get('business_goals', []))
-    validated_data['notes'] = validate_notes(data.get('notes', ''))
+    for field, validator in _REQUIRED_FIELD_VALIDATORS:
+        validated_data[field] = validator(data[field])
+    
+    # Optional fields (empty values short-circuit to the validators' defaults)
+    challenges = data.get('main_challenges')
+    validated_data['main_challenges'] = validate_challenges_list(challenges) if challenges else []
+    goals = data.get('business_goals')
+    validated_data['business_goals'] = validate_goals_list(goals) if goals else []
+    notes = data.get('notes')
+    validated_data['notes'] = validate_notes(notes) if notes else ""
     
     # Business logic validations
     current_revenue = validated_data['monthly_revenue'][-1]
@@ -418,8 +512,8 @@ def validate_api_input(data: Dict[str, Any], required_fields: List[str] = None)
         raise ValidationError("Input must be a valid JSON object")
     
     if required_fields:
-        missing_fields = [field for field in required_fields if field not in data]
+        missing_fields = set(required_fields).difference(data)
         if missing_fields:
-            raise ValidationError(f"Missing required fields: {', '.join(missing_fields)}")
+            raise ValidationError(f"Missing required fields: {', '.join(sorted(missing_fields))}")
     
     return data
\ No newline at end of file
@@ -2,10 +2,11 @@
 
 from app.config import settings
 
-print("=== CONFIG DEBUG ===")
-print(f"API_V1_STR: '{settings.API_V1_STR}'")
-print(f"Type: {type(settings.API_V1_STR)}")
-print(f"Length: {len(settings.API_V1_STR)}")
-print(f"Repr: {repr(settings.API_V1_STR)}")
-print(f"Starts with /: {settings.API_V1_STR.startswith('/')}")
-print("===================")
\ No newline at end of file
+if __name__ == "__main__":
+    print("=== CONFIG DEBUG ===")
+    print(f"API_V1_STR: '{settings.API_V1_STR}'")
+    print(f"Type: {type(settings.API_V1_STR)}")
+    print(f"Length: {len(settings.API_V1_STR)}")
+    print(f"Repr: {repr(settings.API_V1_STR)}")
+    print(f"Starts with /: {settings.API_V1_STR.startswith('/')}")
+    print("===================")
\ No newline at end of file
@@ -0,0 +1,105 @@
+"""Check that build_all_prompts beats four separate recommendation prompt builds."""
+
+import sys
+import os
+import time
+
+# Add the parent directory to the path so we can import app modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.utils.prompt_templates import (
+    ActionPlanPromptTemplates, build_all_prompts, get_immediate_actions_prompt,
+    get_investment_recommendations_prompt, get_strategic_actions_prompt
+)
+
+BUSINESS_COUNT = 20000
+REPEATS = 7
+
+
+def make_sample(i):
+    """Build one distinct (analysis, business, economic) triple."""
+    business_data = {
+        "business_name": f"Sample Business {i}",
+        "sector": "retail",
+        "location": "Austin, TX",
+        "business_type": "retail_shop",
+        "primary_customers": "local_walk_ins",
+        "years_in_business": i % 15,
+        "employees_count": i % 9,
+        "monthly_revenue": [30000 + i, 31000 + i],
+        "monthly_expenses": 20000 + i,
+        "current_cash": 90000 + 7 * i,
+    }
+    analysis_result = {
+        "overall_score": {
+            "overall_score": 60 + i % 30,
+            "improvement_areas": ["cash_flow", "marketing"],
+            "strengths": ["loyal_customers", "location"],
+        },
+        "financial_health": {
+            "status": "good",
+            "cash_runway_months": 4 + i % 8,
+            "monthly_cash_flow": 5000 + i,
+            "debt_capacity": 40000 + i,
+            "health_score": 40 + i % 50,
+        },
+        "market_position": {"performance_category": "average"},
+        "risk_assessment": {"risk_level": "medium", "overall_risk_score": i % 100},
+        "growth_analysis": {"growth_score": 55, "expansion_readiness": {"readiness_level": "partial"}},
+    }
+    economic_data = {
+        "fed_funds_rate": 5.25,
+        "inflation_cpi": 3.1,
+        "business_climate_score": 62,
+        "small_business_impact": {"financing_cost_impact": "high", "overall_impact": "mixed"},
+    }
+    return analysis_result, business_data, economic_data
+
+
+def build_separately(samples):
+    """Call the four builders one by one, as callers did before build_all_prompts."""
+    for analysis_result, business_data, economic_data in samples:
+        get_immediate_actions_prompt(analysis_result, business_data, economic_data)
+        get_strategic_actions_prompt(analysis_result, business_data, economic_data)
+        get_investment_recommendations_prompt(analysis_result, business_data, economic_data)
+        ActionPlanPromptTemplates.get_action_plan_prompt(analysis_result, business_data, economic_data)
+
+
+def build_batched(samples):
+    """Build the same four prompts through build_all_prompts."""
+    for analysis_result, business_data, economic_data in samples:
+        build_all_prompts(analysis_result, business_data, economic_data)
+
+
+def best_times(samples):
+    """Return the fastest of several timed runs of each path, in seconds.
+
+    Runs alternate between the two paths so load on the machine hits both alike.
+    """
+    separate, batched = [], []
+    for _ in range(REPEATS):
+        for func, timings in ((build_separately, separate), (build_batched, batched)):
+            start = time.perf_counter()
+            func(samples)
+            timings.append(time.perf_counter() - start)
+    return min(separate), min(batched)
+
+
+def main():
+    """Time both paths over distinct businesses and fail if batching is not faster."""
+    samples = [make_sample(i) for i in range(BUSINESS_COUNT)]
+
+    separate, batched = best_times(samples)
+
+    print(f"Four separate builds: {separate:.3f}s for {BUSINESS_COUNT} businesses")
+    print(f"build_all_prompts:    {batched:.3f}s for {BUSINESS_COUNT} businesses")
+
+    if batched >= separate:
+        print("❌ build_all_prompts is not faster than the separate builds")
+        sys.exit(1)
+
+    print(f"✅ build_all_prompts is {separate / batched:.2f}x faster")
+
+
+if __name__ == "__main__":
+    main()
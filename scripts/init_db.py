@@ -2,10 +2,9 @@
 
 import sys
 import os
-from pathlib import Path
 
 # Add the parent directory to the path so we can import app modules
-sys.path.append(str(Path(__file__).parent.parent))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.database import init_db, create_tables
 from app.config import settings